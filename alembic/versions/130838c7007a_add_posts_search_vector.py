@@ -0,0 +1,79 @@
+"""Add posts full-text search vector
+
+Revision ID: 130838c7007a
+Revises: 2bf05c0f1a47
+Create Date: 2026-10-18 13:40:02.511873
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '130838c7007a'
+down_revision = '2bf05c0f1a47'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+SEARCH_VECTOR_EXPRESSION = """
+    setweight(to_tsvector('simple'::regconfig, coalesce({row}title, '')), 'A') ||
+    setweight(to_tsvector('simple'::regconfig, coalesce({row}excerpt, '')), 'B') ||
+    setweight(to_tsvector('simple'::regconfig, coalesce({row}content, '')), 'C')
+"""
+
+
+def upgrade() -> None:
+    # Nullable-колонка без значения по умолчанию добавляется без перезаписи таблицы
+    op.execute("ALTER TABLE posts ADD COLUMN search_vector tsvector")
+
+    # Триггер создается до заполнения, чтобы новые и измененные строки не остались пустыми
+    op.execute(
+        f"""
+        CREATE FUNCTION posts_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {SEARCH_VECTOR_EXPRESSION.format(row='NEW.')};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER posts_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF title, excerpt, content ON posts
+        FOR EACH ROW EXECUTE FUNCTION posts_search_vector_update()
+        """
+    )
+
+    # Заполнение диапазонами id, каждый пакет фиксируется отдельно и держит блокировки
+    # только своих строк; CREATE INDEX CONCURRENTLY тоже не может выполняться в транзакции
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        max_id = bind.execute(sa.text("SELECT max(id) FROM posts")).scalar() or 0
+        backfill = sa.text(
+            f"""
+            UPDATE posts SET search_vector = {SEARCH_VECTOR_EXPRESSION.format(row='')}
+            WHERE id >= :start AND id < :stop AND search_vector IS NULL
+            """
+        )
+        for start in range(1, max_id + 1, BACKFILL_BATCH_SIZE):
+            bind.execute(backfill, {"start": start, "stop": start + BACKFILL_BATCH_SIZE})
+
+        op.create_index(
+            'ix_posts_search_vector',
+            'posts',
+            ['search_vector'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_posts_search_vector', table_name='posts', postgresql_concurrently=True)
+
+    op.execute("DROP TRIGGER posts_search_vector_trigger ON posts")
+    op.execute("DROP FUNCTION posts_search_vector_update()")
+    op.drop_column('posts', 'search_vector')
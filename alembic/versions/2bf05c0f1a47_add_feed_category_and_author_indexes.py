@@ -0,0 +1,50 @@
+"""Add feed, category and author indexes
+
+Revision ID: 2bf05c0f1a47
+Revises: 93d41156702f
+Create Date: 2026-10-18 10:12:41.208331
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '2bf05c0f1a47'
+down_revision = '93d41156702f'
+branch_labels = None
+depends_on = None
+
+PUBLISHED_PREDICATE = sa.text('is_published AND is_active')
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY не может выполняться внутри транзакции
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_posts_published_created_at',
+            'posts',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_where=PUBLISHED_PREDICATE,
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_posts_category_published_created_at',
+            'posts',
+            ['category_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_where=PUBLISHED_PREDICATE,
+            postgresql_concurrently=True
+        )
+        op.create_index(op.f('ix_posts_author_id'), 'posts', ['author_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_refresh_tokens_user_id'), 'refresh_tokens', ['user_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_refresh_tokens_expires_at'), 'refresh_tokens', ['expires_at'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(op.f('ix_refresh_tokens_expires_at'), table_name='refresh_tokens', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_refresh_tokens_user_id'), table_name='refresh_tokens', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_posts_author_id'), table_name='posts', postgresql_concurrently=True)
+        op.drop_index('ix_posts_category_published_created_at', table_name='posts', postgresql_concurrently=True)
+        op.drop_index('ix_posts_published_created_at', table_name='posts', postgresql_concurrently=True)
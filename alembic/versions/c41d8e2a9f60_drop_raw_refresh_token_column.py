@@ -0,0 +1,59 @@
+"""Drop raw refresh token column
+
+Revision ID: c41d8e2a9f60
+Revises: fea3913303c3
+Create Date: 2026-10-18 16:42:11.305518
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'c41d8e2a9f60'
+down_revision = 'fea3913303c3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Выполняется после того, как все экземпляры приложения пишут только token_hash
+    op.execute("DROP TRIGGER refresh_tokens_token_hash_trigger ON refresh_tokens")
+    op.execute("DROP FUNCTION refresh_tokens_token_hash_update()")
+
+    with op.get_context().autocommit_block():
+        op.drop_index(op.f('ix_refresh_tokens_token'), table_name='refresh_tokens', postgresql_concurrently=True)
+
+    op.drop_column('refresh_tokens', 'token')
+
+
+def downgrade() -> None:
+    op.add_column('refresh_tokens', sa.Column('token', sa.String(length=512), nullable=True))
+
+    op.execute(
+        """
+        CREATE FUNCTION refresh_tokens_token_hash_update() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.token IS NOT NULL THEN
+                NEW.token_hash := sha256(convert_to(NEW.token, 'UTF8'));
+            END IF;
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER refresh_tokens_token_hash_trigger
+        BEFORE INSERT OR UPDATE OF token ON refresh_tokens
+        FOR EACH ROW EXECUTE FUNCTION refresh_tokens_token_hash_update()
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_refresh_tokens_token'),
+            'refresh_tokens',
+            ['token'],
+            unique=True,
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,93 @@
+"""Store refresh token digests instead of raw tokens
+
+Revision ID: fea3913303c3
+Revises: 130838c7007a
+Create Date: 2026-10-18 16:05:27.940215
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'fea3913303c3'
+down_revision = '130838c7007a'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+def upgrade() -> None:
+    # Nullable-колонка добавляется без перезаписи таблицы; старая колонка token
+    # перестает быть обязательной для новых строк и удаляется следующей миграцией
+    op.add_column('refresh_tokens', sa.Column('token_hash', sa.LargeBinary(length=32), nullable=True))
+    op.alter_column('refresh_tokens', 'token', existing_type=sa.String(length=512), nullable=True)
+
+    # Строки, которые еще пишет предыдущая версия приложения, получают хеш триггером
+    op.execute(
+        """
+        CREATE FUNCTION refresh_tokens_token_hash_update() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.token IS NOT NULL THEN
+                NEW.token_hash := sha256(convert_to(NEW.token, 'UTF8'));
+            END IF;
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER refresh_tokens_token_hash_trigger
+        BEFORE INSERT OR UPDATE OF token ON refresh_tokens
+        FOR EACH ROW EXECUTE FUNCTION refresh_tokens_token_hash_update()
+        """
+    )
+
+    # Заполнение диапазонами id, каждый пакет фиксируется отдельно; индекс строится
+    # CONCURRENTLY, а NOT NULL проверяется через CHECK ... NOT VALID + VALIDATE,
+    # который не блокирует запись. По проверенному CHECK SET NOT NULL не сканирует таблицу.
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        max_id = bind.execute(sa.text("SELECT max(id) FROM refresh_tokens")).scalar() or 0
+        backfill = sa.text(
+            """
+            UPDATE refresh_tokens SET token_hash = sha256(convert_to(token, 'UTF8'))
+            WHERE id >= :start AND id < :stop AND token_hash IS NULL
+            """
+        )
+        for start in range(1, max_id + 1, BACKFILL_BATCH_SIZE):
+            bind.execute(backfill, {"start": start, "stop": start + BACKFILL_BATCH_SIZE})
+
+        op.create_index(
+            op.f('ix_refresh_tokens_token_hash'),
+            'refresh_tokens',
+            ['token_hash'],
+            unique=True,
+            postgresql_concurrently=True
+        )
+
+        op.execute(
+            "ALTER TABLE refresh_tokens ADD CONSTRAINT ck_refresh_tokens_token_hash_not_null "
+            "CHECK (token_hash IS NOT NULL) NOT VALID"
+        )
+        op.execute("ALTER TABLE refresh_tokens VALIDATE CONSTRAINT ck_refresh_tokens_token_hash_not_null")
+        op.alter_column('refresh_tokens', 'token_hash', existing_type=sa.LargeBinary(length=32), nullable=False)
+        op.drop_constraint('ck_refresh_tokens_token_hash_not_null', 'refresh_tokens', type_='check')
+
+
+def downgrade() -> None:
+    # Исходные токены по хешу не восстановить: пользователям придется войти заново
+    op.execute("DELETE FROM refresh_tokens")
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f('ix_refresh_tokens_token_hash'),
+            table_name='refresh_tokens',
+            postgresql_concurrently=True
+        )
+
+    op.execute("DROP TRIGGER refresh_tokens_token_hash_trigger ON refresh_tokens")
+    op.execute("DROP FUNCTION refresh_tokens_token_hash_update()")
+    op.drop_column('refresh_tokens', 'token_hash')
+    op.alter_column('refresh_tokens', 'token', existing_type=sa.String(length=512), nullable=False)
@@ -1,8 +1,13 @@
-from fastapi import Depends, HTTPException, status
+from typing import Optional, Tuple
+from datetime import datetime
+from fastapi import Depends, HTTPException, status, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.security import SecurityService
+from app.core.security import SecurityService, token_revocations
+from app.core.config import settings
+from app.core.cache import principal_cache
 from app.core.database import get_db
+from app.core.pagination import decode_cursor, decode_search_cursor
 from app.repositories.user_repository import UserRepository
 from app.repositories.role_repository import RoleRepository
 from app.repositories.category_repository import CategoryRepository
@@ -17,44 +22,77 @@ from app.services.post_service import PostService
 security = HTTPBearer()
 
 
-async def get_current_user(
-        credentials: HTTPAuthorizationCredentials = Depends(security),
-        db: AsyncSession = Depends(get_db)
+async def get_token_payload(
+        credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> dict:
-    """Зависимость для получения текущего пользователя"""
-    token = credentials.credentials
-    payload = SecurityService.verify_token(token)
-    if not payload:
+    """Зависимость для проверки access токена"""
+    payload = SecurityService.verify_token(credentials.credentials)
+    if not payload or payload.get("type") == "refresh":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token"
         )
+    return payload
 
-    user_repository = UserRepository(db)
-    user = await user_repository.get_with_roles(int(payload["sub"]))
 
-    if not user or not user.is_active:
+async def get_current_user(
+        payload: dict = Depends(get_token_payload),
+        db: AsyncSession = Depends(get_db)
+) -> dict:
+    """Зависимость для получения текущего пользователя"""
+    user_id = int(payload["sub"])
+    principal = principal_cache.get(user_id)
+    if principal is None:
+        user_repository = UserRepository(db)
+        user = await user_repository.get_with_roles(user_id)
+
+        if not user or not user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found"
+            )
+
+        roles = [role.name for role in user.roles] if user.roles else []
+
+        principal = {
+            "id": user.id,
+            "email": user.email,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "is_verified": user.is_verified,
+            "is_active": user.is_active,
+            "created_at": user.created_at,
+            "updated_at": user.updated_at,
+            "roles": roles
+        }
+        principal_cache.set(user_id, principal)
+
+    return {**principal, "roles": list(principal["roles"])}
+
+
+async def get_current_principal(
+        payload: dict = Depends(get_token_payload),
+        db: AsyncSession = Depends(get_db)
+) -> dict:
+    """Зависимость для авторизации: из claims токена (AUTH_STATELESS) или из БД"""
+    if not settings.AUTH_STATELESS:
+        return await get_current_user(payload, db)
+
+    user_id = int(payload["sub"])
+    if token_revocations.is_revoked(user_id, payload.get("iat")):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
+            detail="Token revoked"
         )
 
-    roles = [role.name for role in user.roles] if user.roles else []
-
     return {
-        "id": user.id,
-        "email": user.email,
-        "first_name": user.first_name,
-        "last_name": user.last_name,
-        "is_verified": user.is_verified,
-        "is_active": user.is_active,
-        "created_at": user.created_at,
-        "updated_at": user.updated_at,
-        "roles": roles
+        "id": user_id,
+        "email": payload.get("email"),
+        "roles": list(payload.get("roles", []))
     }
 
 
-async def require_admin(current_user: dict = Depends(get_current_user)) -> dict:
+async def require_admin(current_user: dict = Depends(get_current_principal)) -> dict:
     """Зависимость для проверки прав администратора"""
     if "admin" not in current_user["roles"]:
         raise HTTPException(
@@ -64,11 +102,44 @@ async def require_admin(current_user: dict = Depends(get_current_user)) -> dict:
     return current_user
 
 
-async def require_authenticated(current_user: dict = Depends(get_current_user)) -> dict:
+async def require_authenticated(current_user: dict = Depends(get_current_principal)) -> dict:
     """Зависимость для проверки аутентификации (любой авторизованный пользователь)"""
     return current_user
 
 
+async def get_page_cursor(
+        cursor: Optional[str] = Query(None, description="Курсор из next_cursor предыдущей страницы")
+) -> Optional[Tuple[datetime, int]]:
+    """Зависимость для разбора курсора keyset-пагинации"""
+    if cursor is None:
+        return None
+
+    position = decode_cursor(cursor)
+    if not position:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    return position
+
+
+async def get_search_cursor(
+        q: str = Query(..., min_length=1, max_length=200, description="Поисковый запрос"),
+        cursor: Optional[str] = Query(None, description="Курсор из next_cursor предыдущей страницы поиска")
+) -> Optional[Tuple[float, int]]:
+    """Зависимость для разбора курсора пагинации результатов поиска (курсор другого запроса отклоняется)"""
+    if cursor is None:
+        return None
+
+    position = decode_search_cursor(cursor, q)
+    if not position:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    return position
+
+
 async def get_user_repository(db: AsyncSession = Depends(get_db)) -> UserRepository:
     """Фабрика для создания репозитория пользователей"""
     return UserRepository(db)
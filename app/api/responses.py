@@ -0,0 +1,51 @@
+import hashlib
+from typing import Iterable, Optional
+from fastapi import Request, Response, status
+from app.core.cache import response_cache
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def _cache_key(request: Request) -> tuple:
+    """Ключ кэша ответа: маршрут и отсортированные query-параметры"""
+    return request.url.path, tuple(sorted(request.query_params.multi_items()))
+
+
+def _make_etag(body: bytes) -> str:
+    """Сильный ETag по хешу сериализованного ответа"""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Проверить If-None-Match (слабое сравнение, как требует RFC 9110)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in header.split(","))
+
+
+def _respond(request: Request, body: bytes, etag: str) -> Response:
+    """Ответ 304 для актуальной копии клиента, иначе тело с ETag"""
+    headers = {"ETag": etag}
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type=JSON_MEDIA_TYPE, headers=headers)
+
+
+def get_cached_response(request: Request) -> Optional[Response]:
+    """Готовый ответ из кэша (None при промахе)"""
+    cached = response_cache.get(_cache_key(request))
+    if cached is None:
+        return None
+
+    body, etag = cached
+    return _respond(request, body, etag)
+
+
+def cache_response(request: Request, body: bytes, tags: Iterable[str]) -> Response:
+    """Сохранить сериализованный JSON в кэше и вернуть его клиенту"""
+    etag = _make_etag(body)
+    response_cache.set(_cache_key(request), (body, etag), tags=tags)
+    return _respond(request, body, etag)
@@ -0,0 +1,148 @@
+import csv
+import io
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, Iterable, List, Type, Union
+from fastapi import HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+NDJSON_MEDIA_TYPES = (NDJSON_MEDIA_TYPE, "application/jsonl")
+CSV_MEDIA_TYPE = "text/csv"
+
+# Табличные редакторы исполняют ячейки с этих символов как формулы
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class ExportFormat(str, Enum):
+    """Формат потоковой выгрузки"""
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+def is_ndjson(request: Request) -> bool:
+    """Тело запроса передано построчно в формате NDJSON"""
+    media_type = request.headers.get("content-type", "").split(";", 1)[0].strip().lower()
+    return media_type in NDJSON_MEDIA_TYPES
+
+
+class LineTooLong(ValueError):
+    """Строка NDJSON длиннее допустимого предела (передается как элемент импорта с ошибкой)"""
+
+    def __init__(self, max_line_bytes: int) -> None:
+        super().__init__(f"Line exceeds {max_line_bytes} bytes")
+
+
+async def read_body(request: Request, max_bytes: int) -> bytes:
+    """Тело запроса целиком, не больше max_bytes (иначе 413)"""
+    too_large = HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Request body exceeds {max_bytes} bytes"
+    )
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > max_bytes:
+        raise too_large
+
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > max_bytes:
+            raise too_large
+    return bytes(body)
+
+
+async def iter_ndjson_lines(request: Request, max_line_bytes: int) -> AsyncIterator[Union[bytes, LineTooLong]]:
+    """Непустые строки NDJSON по мере чтения тела запроса (тело целиком в память не загружается)
+
+    Вместо строки длиннее max_line_bytes выдается LineTooLong, а ее остаток
+    пропускается без накопления в буфере.
+    """
+    buffer = b""
+    skipping = False
+    async for chunk in request.stream():
+        *lines, buffer = (buffer + chunk).split(b"\n")
+        for line in lines:
+            if skipping:
+                skipping = False
+            elif len(line) > max_line_bytes:
+                yield LineTooLong(max_line_bytes)
+            elif line.strip():
+                yield line
+        if len(buffer) > max_line_bytes:
+            if not skipping:
+                yield LineTooLong(max_line_bytes)
+                skipping = True
+            buffer = b""
+    if not skipping and buffer.strip():
+        yield buffer
+
+
+async def iter_items(items: Iterable[Any]) -> AsyncIterator[Any]:
+    """Асинхронный итератор по уже разобранным элементам"""
+    for item in items:
+        yield item
+
+
+def _ndjson_chunk(rows: List[BaseModel]) -> str:
+    """Пачка строк в формате NDJSON"""
+    return "".join(row.model_dump_json() + "\n" for row in rows)
+
+
+def _csv_chunk(records: Iterable[Iterable[Any]]) -> str:
+    """Пачка строк CSV"""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(records)
+    return buffer.getvalue()
+
+
+def _csv_cell(value: Any) -> Any:
+    """Значение ячейки CSV: None - пустая строка, строка-формула экранируется апострофом"""
+    if value is None:
+        return ""
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _csv_record(row: BaseModel) -> List[Any]:
+    """Значения строки для CSV"""
+    return [_csv_cell(value) for value in row.model_dump(mode="json").values()]
+
+
+async def _export_body(
+        session_factory: async_sessionmaker,
+        batches: Callable[[AsyncSession], AsyncIterator[List[Any]]],
+        schema: Type[BaseModel],
+        export_format: ExportFormat
+) -> AsyncIterator[str]:
+    """Сериализовать пачки по мере чтения из БД в собственной сессии потока"""
+    async with session_factory() as session:
+        if export_format == ExportFormat.CSV:
+            yield _csv_chunk([list(schema.model_fields)])
+        async for batch in batches(session):
+            rows = [schema.model_validate(item) for item in batch]
+            if export_format == ExportFormat.CSV:
+                yield _csv_chunk(_csv_record(row) for row in rows)
+            else:
+                yield _ndjson_chunk(rows)
+
+
+def export_response(
+        session_factory: async_sessionmaker,
+        batches: Callable[[AsyncSession], AsyncIterator[List[Any]]],
+        schema: Type[BaseModel],
+        export_format: ExportFormat,
+        filename: str
+) -> StreamingResponse:
+    """Потоковый ответ выгрузки в NDJSON или CSV
+
+    Сессия запроса закрывается зависимостью get_db до отправки тела StreamingResponse,
+    поэтому поток открывает отдельную сессию из session_factory и передает ее в batches.
+    """
+    media_type = CSV_MEDIA_TYPE if export_format == ExportFormat.CSV else NDJSON_MEDIA_TYPE
+    return StreamingResponse(
+        _export_body(session_factory, batches, schema, export_format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'}
+    )
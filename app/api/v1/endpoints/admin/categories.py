@@ -12,19 +12,17 @@ router = APIRouter()
 async def create_category(
         category_data: CategoryCreate,
         current_user: dict = Depends(require_admin),
-        category_service: CategoryService = Depends(get_category_service),
-        category_repository: CategoryRepository = Depends(get_category_repository)
+        category_service: CategoryService = Depends(get_category_service)
 ):
     """Создание новой категории (только для администраторов)"""
-    success, error = await category_service.create_category(category_data)
+    category, error = await category_service.create_category(category_data)
 
-    if not success:
+    if not category:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=error
         )
 
-    category = await category_repository.get_by_slug(category_data.slug)
     return category
 
 
@@ -63,19 +61,17 @@ async def update_category(
         category_id: int,
         category_data: CategoryUpdate,
         current_user: dict = Depends(require_admin),
-        category_service: CategoryService = Depends(get_category_service),
-        category_repository: CategoryRepository = Depends(get_category_repository)
+        category_service: CategoryService = Depends(get_category_service)
 ):
     """Обновление категории (только для администраторов)"""
-    success, error = await category_service.update_category(category_id, category_data)
+    category, error = await category_service.update_category(category_id, category_data)
 
-    if not success:
+    if not category:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=error
         )
 
-    category = await category_repository.get_by_id(category_id)
     return category
 
 
@@ -1,6 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import json
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from app.api.dependencies import require_admin, get_post_service, get_post_repository
-from app.schemas.post import PostCreate, PostUpdate, PostResponse, PostListResponse
+from app.api.streaming import is_ndjson, iter_ndjson_lines, iter_items, read_body, ExportFormat, export_response
+from app.core.config import settings
+from app.core.database import get_session_factory
+from app.schemas.post import (
+    PostCreate,
+    PostUpdate,
+    PostResponse,
+    PostListResponse,
+    PostImportResponse,
+    PostExportRow
+)
 from app.services.post_service import PostService
 from app.repositories.post_repository import PostRepository
 
@@ -11,41 +23,92 @@ router = APIRouter()
 async def create_post(
         post_data: PostCreate,
         current_user: dict = Depends(require_admin),
-        post_service: PostService = Depends(get_post_service),
-        post_repository: PostRepository = Depends(get_post_repository)
+        post_service: PostService = Depends(get_post_service)
 ):
     """Создание нового поста (только для администраторов)"""
-    success, error = await post_service.create_post(current_user["id"], post_data)
+    post, error = await post_service.create_post(current_user["id"], post_data)
 
-    if not success:
+    if not post:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=error
         )
 
-    post = await post_repository.get_by_slug(post_data.slug)
     return post
 
 
+@router.post("/bulk", response_model=PostImportResponse)
+async def import_posts(
+        request: Request,
+        current_user: dict = Depends(require_admin),
+        post_service: PostService = Depends(get_post_service)
+):
+    """Массовый импорт постов: JSON-массив PostCreate или поток NDJSON (только для администраторов)"""
+    if is_ndjson(request):
+        items = iter_ndjson_lines(request, settings.BULK_IMPORT_MAX_LINE_BYTES)
+    else:
+        body = await read_body(request, settings.BULK_IMPORT_MAX_BODY_BYTES)
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid JSON body"
+            )
+        if not isinstance(payload, list):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Expected a JSON array of posts"
+            )
+        items = iter_items(payload)
+
+    results = await post_service.import_posts(current_user["id"], items)
+    created = sum(1 for result in results if result.id is not None)
+
+    return PostImportResponse(
+        created=created,
+        failed=len(results) - created,
+        results=results
+    )
+
+
 @router.get("/", response_model=PostListResponse)
 async def get_posts(
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=1000),
         current_user: dict = Depends(require_admin),
-        post_repository: PostRepository = Depends(get_post_repository)
+        post_repository: PostRepository = Depends(get_post_repository),
+        post_service: PostService = Depends(get_post_service)
 ):
     """Получение списка постов (только для администраторов)"""
     posts = await post_repository.get_all(skip=skip, limit=limit)
-    total = len(posts)
+    total, total_is_exact = await post_service.get_total()
 
     return PostListResponse(
         posts=posts,
         total=total,
+        total_is_exact=total_is_exact,
         skip=skip,
         limit=limit
     )
 
 
+@router.get("/export")
+async def export_posts(
+        format: ExportFormat = Query(ExportFormat.NDJSON),
+        current_user: dict = Depends(require_admin),
+        session_factory: async_sessionmaker = Depends(get_session_factory)
+):
+    """Потоковая выгрузка всех постов в NDJSON или CSV (только для администраторов)"""
+    return export_response(
+        session_factory,
+        lambda session: PostRepository(session).stream_all(settings.EXPORT_BATCH_SIZE),
+        PostExportRow,
+        format,
+        "posts"
+    )
+
+
 @router.get("/{post_id}", response_model=PostResponse)
 async def get_post(
         post_id: int,
@@ -69,19 +132,17 @@ async def update_post(
         post_id: int,
         post_data: PostUpdate,
         current_user: dict = Depends(require_admin),
-        post_service: PostService = Depends(get_post_service),
-        post_repository: PostRepository = Depends(get_post_repository)
+        post_service: PostService = Depends(get_post_service)
 ):
     """Обновление поста (только для администраторов)"""
-    success, error = await post_service.update_post(post_id, post_data)
+    post, error = await post_service.update_post(post_id, post_data)
 
-    if not success:
+    if not post:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=error
         )
 
-    post = await post_repository.get_by_id(post_id)
     return post
 
 
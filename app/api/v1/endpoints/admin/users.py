@@ -1,6 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from app.api.dependencies import require_admin, get_user_service, get_user_repository
-from app.schemas.user import UserWithRolesResponse, UserRoleUpdate, UserListResponse
+from app.api.streaming import ExportFormat, export_response
+from app.core.config import settings
+from app.core.database import get_session_factory
+from app.schemas.user import UserWithRolesResponse, UserRoleUpdate, UserListResponse, UserExportRow
 from app.services.user_service import UserService
 from app.repositories.user_repository import UserRepository
 
@@ -43,6 +47,22 @@ async def get_users(
     )
 
 
+@router.get("/export")
+async def export_users(
+        format: ExportFormat = Query(ExportFormat.NDJSON),
+        current_user: dict = Depends(require_admin),
+        session_factory: async_sessionmaker = Depends(get_session_factory)
+):
+    """Потоковая выгрузка всех пользователей в NDJSON или CSV, без ролей (только для администраторов)"""
+    return export_response(
+        session_factory,
+        lambda session: UserRepository(session).stream_all(settings.EXPORT_BATCH_SIZE),
+        UserExportRow,
+        format,
+        "users"
+    )
+
+
 @router.put("/{user_id}/roles", response_model=UserWithRolesResponse)
 async def update_user_roles(
         user_id: int,
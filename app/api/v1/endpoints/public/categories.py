@@ -1,48 +1,79 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cache import CATEGORIES_TAG, CATEGORY_FEEDS_TAG, category_tag
+from app.core.category_registry import category_registry
 from app.core.database import get_db
-from app.repositories.category_repository import CategoryRepository
+from app.core.pagination import encode_cursor, split_page
+from app.api.dependencies import get_page_cursor, get_post_service
+from app.api.responses import get_cached_response, cache_response
 from app.repositories.post_repository import PostRepository
+from app.repositories.loaders import LoadProfile
 from app.schemas.category import CategoryResponse
-from app.schemas.post import PostListResponse
-from typing import List
+from app.schemas.post import PostSummaryListResponse
+from app.services.post_service import PostService
+from typing import List, Optional, Tuple
+from datetime import datetime
 
 router = APIRouter()
 
+category_list_adapter = TypeAdapter(List[CategoryResponse])
+
 
 @router.get("/", response_model=List[CategoryResponse])
 async def get_categories(
+        request: Request,
         db: AsyncSession = Depends(get_db)
 ):
     """Получение списка категорий (публичный доступ)"""
-    category_repository = CategoryRepository(db)
-    categories = await category_repository.get_all_active()
-    return categories
+    cached = get_cached_response(request)
+    if cached:
+        return cached
+
+    snapshot = await category_registry.snapshot(db)
+
+    body = category_list_adapter.dump_json(
+        category_list_adapter.validate_python(snapshot.active, from_attributes=True)
+    )
+    return cache_response(request, body, tags=[CATEGORIES_TAG])
 
 
-@router.get("/{slug}/posts", response_model=PostListResponse)
+@router.get("/{slug}/posts", response_model=PostSummaryListResponse)
 async def get_posts_by_category(
+        request: Request,
         slug: str,
         skip: int = Query(0, ge=0),
         limit: int = Query(10, ge=1, le=50),
-        db: AsyncSession = Depends(get_db)
+        position: Optional[Tuple[datetime, int]] = Depends(get_page_cursor),
+        db: AsyncSession = Depends(get_db),
+        post_service: PostService = Depends(get_post_service)
 ):
     """Получение постов по категории (публичный доступ)"""
-    category_repository = CategoryRepository(db)
-    post_repository = PostRepository(db)
+    cached = get_cached_response(request)
+    if cached:
+        return cached
 
-    category = await category_repository.get_by_slug(slug)
+    category = await category_registry.get_by_slug(db, slug)
     if not category or not category.is_active:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Category not found"
         )
 
-    posts = await post_repository.get_posts_by_category(slug, skip=skip, limit=limit)
+    post_repository = PostRepository(db)
+    rows = await post_repository.get_published_posts(
+        skip=skip, limit=limit + 1, cursor=position, category_id=category.id, profile=LoadProfile.SUMMARY
+    )
+    posts, has_more = split_page(rows, limit)
+    total, total_is_exact = await post_service.get_published_total(category.id)
 
-    return PostListResponse(
+    page = PostSummaryListResponse(
         posts=posts,
-        total=len(posts),
+        total=total,
+        total_is_exact=total_is_exact,
         skip=skip,
-        limit=limit
-    )
\ No newline at end of file
+        limit=limit,
+        next_cursor=encode_cursor(posts[-1].created_at, posts[-1].id) if has_more else None,
+        has_more=has_more
+    )
+    return cache_response(request, page.model_dump_json().encode(), tags=[CATEGORY_FEEDS_TAG, category_tag(category.id)])
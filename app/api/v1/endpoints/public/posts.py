@@ -1,36 +1,83 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, Tuple
+from datetime import datetime
+from app.core.cache import FEED_TAG, post_tag, category_tag, author_tag
 from app.core.database import get_db
+from app.core.pagination import encode_cursor, encode_search_cursor, split_page
+from app.api.dependencies import get_page_cursor, get_search_cursor, get_post_service
+from app.api.responses import get_cached_response, cache_response
 from app.repositories.post_repository import PostRepository
-from app.schemas.post import PostResponse, PostListResponse
+from app.repositories.loaders import LoadProfile
+from app.schemas.post import PostResponse, PostSummaryListResponse, PostSearchResponse
+from app.services.post_service import PostService
 
 router = APIRouter()
 
 
-@router.get("/", response_model=PostListResponse)
+@router.get("/", response_model=PostSummaryListResponse)
 async def get_posts(
+        request: Request,
         skip: int = Query(0, ge=0),
         limit: int = Query(10, ge=1, le=50),
-        db: AsyncSession = Depends(get_db)
+        position: Optional[Tuple[datetime, int]] = Depends(get_page_cursor),
+        db: AsyncSession = Depends(get_db),
+        post_service: PostService = Depends(get_post_service)
 ):
     """Получение списка опубликованных постов (публичный доступ)"""
+    cached = get_cached_response(request)
+    if cached:
+        return cached
+
     post_repository = PostRepository(db)
-    posts = await post_repository.get_published_posts(skip=skip, limit=limit)
+    rows = await post_repository.get_published_posts(skip=skip, limit=limit + 1, cursor=position, profile=LoadProfile.SUMMARY)
+    posts, has_more = split_page(rows, limit)
+    total, total_is_exact = await post_service.get_published_total()
 
-    return PostListResponse(
+    page = PostSummaryListResponse(
         posts=posts,
-        total=len(posts),
+        total=total,
+        total_is_exact=total_is_exact,
         skip=skip,
-        limit=limit
+        limit=limit,
+        next_cursor=encode_cursor(posts[-1].created_at, posts[-1].id) if has_more else None,
+        has_more=has_more
+    )
+    return cache_response(request, page.model_dump_json().encode(), tags=[FEED_TAG])
+
+
+@router.get("/search", response_model=PostSearchResponse)
+async def search_posts(
+        q: str = Query(..., min_length=1, max_length=200, description="Поисковый запрос"),
+        limit: int = Query(10, ge=1, le=50),
+        position: Optional[Tuple[float, int]] = Depends(get_search_cursor),
+        db: AsyncSession = Depends(get_db)
+):
+    """Полнотекстовый поиск по опубликованным постам (публичный доступ)"""
+    post_repository = PostRepository(db)
+    rows = await post_repository.search_published_posts(q, limit=limit + 1, cursor=position)
+    results, has_more = split_page(rows, limit)
+
+    last_post, last_rank = results[-1] if results else (None, None)
+    return PostSearchResponse(
+        posts=[post for post, _ in results],
+        limit=limit,
+        next_cursor=encode_search_cursor(last_rank, last_post.id, q) if has_more else None,
+        has_more=has_more
     )
 
 
 @router.get("/{slug}", response_model=PostResponse)
 async def get_post_by_slug(
+        request: Request,
         slug: str,
         db: AsyncSession = Depends(get_db)
 ):
     """Получение поста по slug (публичный доступ)"""
+    cached = get_cached_response(request)
+    if cached:
+        return cached
+
     post_repository = PostRepository(db)
     post = await post_repository.get_by_slug(slug)
 
@@ -40,4 +87,9 @@ async def get_post_by_slug(
             detail="Post not found"
         )
 
-    return post
\ No newline at end of file
+    body = PostResponse.model_validate(post).model_dump_json().encode()
+    return cache_response(
+        request,
+        body,
+        tags=[post_tag(post.id), category_tag(post.category_id), author_tag(post.author_id)]
+    )
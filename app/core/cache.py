@@ -0,0 +1,118 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Set, Tuple
+from app.core.config import settings
+
+FEED_TAG = "feed"
+CATEGORIES_TAG = "categories"
+CATEGORY_FEEDS_TAG = "category-feeds"
+
+
+def post_tag(post_id: int) -> str:
+    """Тег записей кэша, зависящих от поста"""
+    return f"post:{post_id}"
+
+
+def category_tag(category_id: int) -> str:
+    """Тег записей кэша, зависящих от категории"""
+    return f"category:{category_id}"
+
+
+def author_tag(user_id: int) -> str:
+    """Тег записей кэша, включающих данные автора"""
+    return f"author:{user_id}"
+
+
+class TTLCache:
+    """Потокобезопасный in-memory кэш с временем жизни записей, вытеснением LRU и тегами"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any, Tuple[str, ...]]]" = OrderedDict()
+        self._tags: Dict[str, Set[Hashable]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Получить значение (просроченная запись удаляется при обращении)"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                self._remove(key)
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None, tags: Iterable[str] = ()) -> None:
+        """Сохранить значение, вытеснив самые давно использованные записи сверх лимита"""
+        expires_at = time.monotonic() + (self._ttl if ttl is None else ttl)
+        tags = tuple(tags)
+        with self._lock:
+            self._remove(key)
+            self._data[key] = (expires_at, value, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+
+            while len(self._data) > self._maxsize:
+                self._remove(next(iter(self._data)))
+                self.evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        """Удалить запись"""
+        with self._lock:
+            self._remove(key)
+
+    def invalidate_tags(self, *tags: str) -> None:
+        """Удалить все записи, помеченные любым из тегов"""
+        with self._lock:
+            for tag in tags:
+                for key in list(self._tags.get(tag, ())):
+                    self._remove(key)
+
+    def clear(self) -> None:
+        """Удалить все записи"""
+        with self._lock:
+            self._data.clear()
+            self._tags.clear()
+
+    def stats(self) -> dict:
+        """Счетчики кэша"""
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "maxsize": self._maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        """Удалить запись вместе с ее тегами (вызывается под блокировкой)"""
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return
+
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+post_count_cache = TTLCache(maxsize=1024, ttl=settings.POST_COUNT_CACHE_TTL_SECONDS)
+response_cache = TTLCache(maxsize=settings.RESPONSE_CACHE_MAX_ENTRIES, ttl=settings.RESPONSE_CACHE_TTL_SECONDS)
+principal_cache = TTLCache(maxsize=settings.PRINCIPAL_CACHE_MAX_ENTRIES, ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS)
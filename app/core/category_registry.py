@@ -0,0 +1,116 @@
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.models.category import Category
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CategoryEntry:
+    """Неизменяемая копия строки категории"""
+    id: int
+    name: str
+    slug: str
+    description: Optional[str]
+    is_active: bool
+    created_at: datetime
+    updated_at: Optional[datetime]
+
+
+@dataclass(frozen=True)
+class CategorySnapshot:
+    """Неизменяемый снимок всех категорий с индексами по id и slug"""
+    by_id: Mapping[int, CategoryEntry] = field(default_factory=lambda: MappingProxyType({}))
+    by_slug: Mapping[str, CategoryEntry] = field(default_factory=lambda: MappingProxyType({}))
+    loaded_at: float = 0.0
+
+    @classmethod
+    def build(cls, entries: Tuple[CategoryEntry, ...]) -> "CategorySnapshot":
+        """Построить снимок из набора категорий"""
+        return cls(
+            by_id=MappingProxyType({entry.id: entry for entry in entries}),
+            by_slug=MappingProxyType({entry.slug: entry for entry in entries}),
+            loaded_at=time.monotonic()
+        )
+
+    @property
+    def active(self) -> Tuple[CategoryEntry, ...]:
+        """Активные категории в порядке id"""
+        return tuple(entry for entry in self.by_id.values() if entry.is_active)
+
+
+class CategoryRegistry:
+    """Реестр категорий процесса: поиск по словарю вместо запроса к БД
+
+    Снимок заменяется целиком одним присваиванием, поэтому читатели никогда не видят
+    его в промежуточном состоянии. Обновление происходит при старте приложения, после
+    изменений в CategoryService, по истечении TTL и при промахе (не чаще раза в
+    CATEGORY_REGISTRY_MISS_REFRESH_SECONDS), чтобы подхватывать изменения других процессов.
+    """
+
+    def __init__(self, ttl: float, miss_refresh_interval: float):
+        self._ttl = ttl
+        self._miss_refresh_interval = miss_refresh_interval
+        self._snapshot: Optional[CategorySnapshot] = None
+
+    async def refresh(self, session: AsyncSession) -> CategorySnapshot:
+        """Перечитать категории из БД и атомарно заменить снимок"""
+        try:
+            result = await session.execute(
+                select(
+                    Category.id, Category.name, Category.slug, Category.description,
+                    Category.is_active, Category.created_at, Category.updated_at
+                ).order_by(Category.id)
+            )
+            snapshot = CategorySnapshot.build(tuple(CategoryEntry(*row) for row in result.all()))
+        except SQLAlchemyError as error:
+            logger.error(f"Error loading category registry: {error}")
+            return self._snapshot or CategorySnapshot()
+
+        self._snapshot = snapshot
+        return snapshot
+
+    async def snapshot(self, session: AsyncSession) -> CategorySnapshot:
+        """Текущий снимок (загружается при первом обращении и по истечении TTL)"""
+        snapshot = self._snapshot
+        if snapshot is None or time.monotonic() - snapshot.loaded_at >= self._ttl:
+            snapshot = await self.refresh(session)
+        return snapshot
+
+    async def get_by_id(self, session: AsyncSession, category_id: int) -> Optional[CategoryEntry]:
+        """Найти категорию по ID"""
+        snapshot = await self.snapshot(session)
+        entry = snapshot.by_id.get(category_id)
+        if entry is None and self._can_refresh_on_miss(snapshot):
+            entry = (await self.refresh(session)).by_id.get(category_id)
+        return entry
+
+    async def get_by_slug(self, session: AsyncSession, slug: str) -> Optional[CategoryEntry]:
+        """Найти категорию по slug"""
+        snapshot = await self.snapshot(session)
+        entry = snapshot.by_slug.get(slug)
+        if entry is None and self._can_refresh_on_miss(snapshot):
+            entry = (await self.refresh(session)).by_slug.get(slug)
+        return entry
+
+    def invalidate(self) -> None:
+        """Сбросить снимок (следующее обращение перечитает категории)"""
+        self._snapshot = None
+
+    def _can_refresh_on_miss(self, snapshot: CategorySnapshot) -> bool:
+        """Разрешено ли перечитать категории при промахе"""
+        return time.monotonic() - snapshot.loaded_at >= self._miss_refresh_interval
+
+
+category_registry = CategoryRegistry(
+    ttl=settings.CATEGORY_REGISTRY_TTL_SECONDS,
+    miss_refresh_interval=settings.CATEGORY_REGISTRY_MISS_REFRESH_SECONDS
+)
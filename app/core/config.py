@@ -1,4 +1,4 @@
-from pydantic import ConfigDict, validator
+from pydantic import ConfigDict, field_validator, validator
 from pydantic_settings import BaseSettings
 import os
 
@@ -14,9 +14,52 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    MAX_REFRESH_TOKENS_PER_USER: int = 10
+    # Сколько последних погашенных токенов хранить для распознавания повторного использования
+    MAX_CONSUMED_REFRESH_TOKENS_PER_USER: int = 5
+    # Авторизация по ролям из access токена без обращения к БД
+    AUTH_STATELESS: bool = False
+    TOKEN_CACHE_MAX_ENTRIES: int = 10000
 
     # Security
     BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_CONCURRENCY: int = os.cpu_count() or 2
+
+    # Post counters
+    POST_COUNT_CACHE_TTL_SECONDS: int = 300
+    POST_COUNT_APPROXIMATE: bool = False
+    POST_COUNT_APPROXIMATE_MIN_ROWS: int = 100000
+
+    # Response cache
+    RESPONSE_CACHE_TTL_SECONDS: int = 60
+    RESPONSE_CACHE_MAX_ENTRIES: int = 2048
+
+    # Principal cache
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+
+    # Expired refresh token sweeper
+    TOKEN_SWEEPER_ENABLED: bool = True
+    TOKEN_SWEEPER_INTERVAL_SECONDS: int = 3600
+    TOKEN_SWEEPER_BATCH_SIZE: int = 1000
+    # Доля времени, которую очистка занимает БД между пачками (0 < x <= 1)
+    TOKEN_SWEEPER_DUTY_CYCLE: float = 0.2
+
+    # Bulk post import
+    BULK_IMPORT_CHUNK_SIZE: int = 500
+    # Предел тела JSON-массива (читается целиком) и одной строки NDJSON
+    BULK_IMPORT_MAX_BODY_BYTES: int = 10 * 1024 * 1024
+    BULK_IMPORT_MAX_LINE_BYTES: int = 1024 * 1024
+    SANITIZE_PROCESSES: int = os.cpu_count() or 2
+    # Меньшие пачки санитизируются в текущем процессе: передача в пул дороже самой работы
+    SANITIZE_PARALLEL_MIN_ITEMS: int = 64
+
+    # Streaming export
+    EXPORT_BATCH_SIZE: int = 1000
+
+    # Category registry
+    CATEGORY_REGISTRY_TTL_SECONDS: int = 300
+    CATEGORY_REGISTRY_MISS_REFRESH_SECONDS: float = 1.0
 
     @validator("DATABASE_URL", pre=True)
     def assemble_db_connection(cls, v: str, values: dict) -> str:
@@ -29,6 +72,14 @@ class Settings(BaseSettings):
 
         return v
 
+    @field_validator("TOKEN_SWEEPER_DUTY_CYCLE")
+    @classmethod
+    def validate_duty_cycle(cls, v: float) -> float:
+        """Доля занятости очистки должна быть в (0, 1]: пауза между пачками делится на нее"""
+        if not 0 < v <= 1:
+            raise ValueError("TOKEN_SWEEPER_DUTY_CYCLE must be in (0, 1]")
+        return v
+
     model_config = ConfigDict(env_file=".env")
 
 
@@ -34,4 +34,8 @@ db_manager = DatabaseManager()
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Зависимость для получения сессии БД"""
     async for session in db_manager.get_session():
-        yield session
\ No newline at end of file
+        yield session
+
+async def get_session_factory() -> async_sessionmaker:
+    """Зависимость для получения фабрики сессий (для работы, переживающей запрос, например потоковой выгрузки)"""
+    return db_manager.async_session
@@ -0,0 +1,66 @@
+import base64
+import hashlib
+import json
+from datetime import datetime
+from typing import Optional, Tuple, List, Sequence, TypeVar
+
+T = TypeVar('T')
+
+
+def _encode(values: list) -> str:
+    """Упаковать значения курсора в непрозрачную url-safe строку"""
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> list:
+    """Распаковать значения курсора (ValueError для некорректной строки)"""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    if not isinstance(values, list):
+        raise ValueError("Cursor payload must be a list")
+    return values
+
+
+def encode_cursor(created_at: datetime, item_id: int) -> str:
+    """Курсор keyset-пагинации по ключу (created_at, id)"""
+    return _encode([created_at.isoformat(), item_id])
+
+
+def decode_cursor(cursor: str) -> Optional[Tuple[datetime, int]]:
+    """Разобрать курсор (created_at, id), None для некорректного значения"""
+    try:
+        created_at, item_id = _decode(cursor)
+        return datetime.fromisoformat(created_at), int(item_id)
+    except (ValueError, TypeError):
+        return None
+
+
+def _query_digest(query: str) -> str:
+    """Короткий отпечаток поискового запроса, к которому привязан курсор"""
+    return hashlib.sha256(query.encode()).hexdigest()[:16]
+
+
+def encode_search_cursor(rank: float, item_id: int, query: str) -> str:
+    """Курсор пагинации результатов поиска по ключу (rank, id), привязанный к запросу
+
+    rank имеет смысл только для того запроса, которым он получен, поэтому
+    в курсор входит отпечаток запроса.
+    """
+    return _encode([rank, item_id, _query_digest(query)])
+
+
+def decode_search_cursor(cursor: str, query: str) -> Optional[Tuple[float, int]]:
+    """Разобрать курсор поиска (rank, id), None для некорректного значения или чужого запроса"""
+    try:
+        rank, item_id, digest = _decode(cursor)
+        if digest != _query_digest(query):
+            return None
+        return float(rank), int(item_id)
+    except (ValueError, TypeError):
+        return None
+
+
+def split_page(items: Sequence[T], limit: int) -> Tuple[List[T], bool]:
+    """Отделить страницу от лишней строки, запрошенной для признака has_more"""
+    return list(items[:limit]), len(items) > limit
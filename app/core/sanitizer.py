@@ -0,0 +1,62 @@
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence
+from app.core.config import settings
+from app.models.post import Post
+
+
+def _sanitize_batch(contents: Sequence[str]) -> List[str]:
+    """Санитизировать пачку HTML (выполняется в процессе пула)"""
+    return [Post.sanitize_html(content) for content in contents]
+
+
+class ContentSanitizer:
+    """Пул процессов для Post.sanitize_html при массовом импорте
+
+    bleach работает на чистом Python и держит GIL, поэтому потоки не дают
+    параллелизма. Пачка делится на части по числу процессов; небольшие пачки
+    обрабатываются в текущем процессе.
+    """
+
+    def __init__(self, max_workers: int, min_parallel_items: int):
+        self._max_workers = max_workers
+        self._min_parallel_items = min_parallel_items
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    async def sanitize_many(self, contents: Sequence[str]) -> List[str]:
+        """Санитизировать тексты с сохранением порядка"""
+        if len(contents) < self._min_parallel_items:
+            return _sanitize_batch(contents)
+
+        with self._lock:
+            if self._executor is None:
+                # spawn: дочерние процессы не наследуют потоки и event loop родителя
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            executor = self._executor
+
+        loop = asyncio.get_running_loop()
+        size = -(-len(contents) // self._max_workers)
+        parts = await asyncio.gather(*(
+            loop.run_in_executor(executor, _sanitize_batch, contents[start:start + size])
+            for start in range(0, len(contents), size)
+        ))
+        return [content for part in parts for content in part]
+
+    def shutdown(self) -> None:
+        """Остановить пул (при следующем вызове будет создан новый)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+content_sanitizer = ContentSanitizer(
+    max_workers=settings.SANITIZE_PROCESSES,
+    min_parallel_items=settings.SANITIZE_PARALLEL_MIN_ITEMS
+)
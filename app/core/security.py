@@ -1,10 +1,133 @@
+import asyncio
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from passlib.context import CryptContext
 from jose import JWTError, jwt
 from datetime import datetime, timedelta, UTC
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Tuple
+from app.core.cache import TTLCache, principal_cache
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Хеши с другой стоимостью считаются устаревшими и перехешируются при входе
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_desired_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_desired_rounds=settings.BCRYPT_ROUNDS
+)
+
+
+class PasswordHasher:
+    """Выделенный пул потоков для bcrypt, чтобы хеширование не блокировало event loop
+
+    Число потоков ограничивает одновременные вычисления, остальные запросы ждут в
+    очереди пула. bcrypt отпускает GIL, поэтому потоки нагружают разные ядра.
+    """
+
+    def __init__(self, max_workers: int):
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Выполнить функцию в пуле и дождаться результата"""
+        submitted_at = time.perf_counter()
+        with self._lock:
+            self.queued += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="password-hasher")
+            executor = self._executor
+
+        def task() -> Any:
+            wait = time.perf_counter() - submitted_at
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+                self.total_wait += wait
+                self.max_wait = max(self.max_wait, wait)
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.completed += 1
+
+        return await asyncio.get_running_loop().run_in_executor(executor, task)
+
+    def stats(self) -> dict:
+        """Счетчики очереди"""
+        with self._lock:
+            return {
+                "max_workers": self._max_workers,
+                "queued": self.queued,
+                "running": self.running,
+                "completed": self.completed,
+                "avg_wait_ms": round(self.total_wait / self.completed * 1000, 3) if self.completed else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3)
+            }
+
+    def shutdown(self) -> None:
+        """Остановить пул (при следующем вызове будет создан новый)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_hasher = PasswordHasher(max_workers=settings.PASSWORD_HASH_CONCURRENCY)
+
+
+class TokenRevocationList:
+    """Отзыв access токенов пользователя, выданных до момента изменения его прав
+
+    Запись хранится в течение времени жизни access токена: более старые токены
+    к этому моменту истекают сами.
+    """
+
+    def __init__(self, lifetime: float):
+        self._lifetime = lifetime
+        self._revoked_at: Dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def revoke(self, user_id: int) -> None:
+        """Отозвать все токены пользователя, выданные до текущего момента"""
+        now = time.time()
+        with self._lock:
+            self._revoked_at[user_id] = now
+            expired = [key for key, revoked_at in self._revoked_at.items() if now - revoked_at > self._lifetime]
+            for key in expired:
+                del self._revoked_at[key]
+
+    def is_revoked(self, user_id: int, issued_at: Optional[float]) -> bool:
+        """Проверить, отозван ли токен, выданный в момент issued_at"""
+        with self._lock:
+            revoked_at = self._revoked_at.get(user_id)
+        if revoked_at is None or time.time() - revoked_at > self._lifetime:
+            return False
+        return issued_at is None or issued_at <= revoked_at
+
+    def clear(self) -> None:
+        """Удалить все записи"""
+        with self._lock:
+            self._revoked_at.clear()
+
+
+token_revocations = TokenRevocationList(lifetime=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+token_cache = TTLCache(maxsize=settings.TOKEN_CACHE_MAX_ENTRIES, ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+
+
+def invalidate_principal(user_id: int) -> None:
+    """Сбросить кэшированного пользователя и отозвать его выданные токены"""
+    principal_cache.pop(user_id)
+    token_revocations.revoke(user_id)
 
 
 class SecurityService:
@@ -20,16 +143,33 @@ class SecurityService:
         """Проверка пароля"""
         return pwd_context.verify(plain_password, hashed_password)
 
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        """Хеширование пароля в пуле password_hasher"""
+        return await password_hasher.run(pwd_context.hash, password)
+
+    @staticmethod
+    async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+        """Проверка пароля в пуле password_hasher"""
+        return await password_hasher.run(pwd_context.verify, plain_password, hashed_password)
+
+    @staticmethod
+    async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """Проверка пароля с новым хешем, если стоимость хеша отличается от BCRYPT_ROUNDS"""
+        return await password_hasher.run(pwd_context.verify_and_update, plain_password, hashed_password)
+
     @staticmethod
     def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
         """Создание access token"""
         to_encode = data.copy()
+        now = datetime.now(UTC)
         if expires_delta:
-            expire = datetime.now(UTC) + expires_delta
+            expire = now + expires_delta
         else:
-            expire = datetime.now(UTC) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+            expire = now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
-        to_encode.update({"exp": expire})
+        # iat с долями секунды: отзыв отделяет токены, выданные в ту же секунду после него
+        to_encode.update({"exp": expire, "iat": now.timestamp()})
         encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
         return encoded_jwt
 
@@ -37,16 +177,32 @@ class SecurityService:
     def create_refresh_token(data: dict) -> str:
         """Создание refresh token"""
         to_encode = data.copy()
-        expire = datetime.now(UTC) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-        to_encode.update({"exp": expire, "type": "refresh"})
+        now = datetime.now(UTC)
+        expire = now + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+        to_encode.update({"exp": expire, "iat": now.timestamp(), "type": "refresh"})
         encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
         return encoded_jwt
 
+    @staticmethod
+    def token_digest(token: str) -> bytes:
+        """SHA-256 токена: ключ кэша, не хранящий сам токен"""
+        return hashlib.sha256(token.encode()).digest()
+
     @staticmethod
     def verify_token(token: str) -> Optional[dict]:
-        """Верификация токена"""
+        """Верификация токена (проверенный payload кэшируется до истечения exp)"""
+        digest = SecurityService.token_digest(token)
+        payload = token_cache.get(digest)
+        if payload is not None:
+            return dict(payload)
+
         try:
             payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-            return payload
         except JWTError:
-            return None
\ No newline at end of file
+            return None
+
+        # refresh токены одноразовые: кэшировать их бессмысленно
+        ttl = payload.get("exp", 0) - time.time()
+        if ttl > 0 and payload.get("type") != "refresh":
+            token_cache.set(digest, payload, ttl=ttl)
+        return dict(payload)
\ No newline at end of file
@@ -1,7 +1,14 @@
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Depends
+from app.api.dependencies import require_admin
 from app.api.v1.router import api_router
 from app.core.database import db_manager
+from app.core.category_registry import category_registry
+from app.core.security import token_cache, password_hasher
+from app.core.sanitizer import content_sanitizer
+from app.core.config import settings
+from app.services.token_sweeper import token_sweeper
+from app.core.cache import response_cache, post_count_cache, principal_cache
 from sqlalchemy import text
 
 async def startup():
@@ -17,17 +24,27 @@ async def startup():
                 print("❌ Database connection test failed")
     except Exception as e:
         print(f"❌ Database connection error: {e}")
+        return
+
+    async with db_manager.async_session() as session:
+        snapshot = await category_registry.refresh(session)
+    print(f"✅ Category registry loaded ({len(snapshot.by_id)} categories)")
 
 async def shutdown():
     """Действия при остановке приложения"""
     print("🛑 Blog Backend API shutting down...")
+    password_hasher.shutdown()
+    content_sanitizer.shutdown()
     await db_manager.engine.dispose()
     print("✅ Database connections closed")
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await startup()
+    if settings.TOKEN_SWEEPER_ENABLED:
+        token_sweeper.start()
     yield
+    await token_sweeper.stop()
     await shutdown()
 
 app = FastAPI(
@@ -47,4 +64,16 @@ async def root():
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy"}
+
+@app.get("/metrics")
+async def metrics(current_user: dict = Depends(require_admin)):
+    """Счетчики in-process кэшей и фоновых задач (только для администраторов)"""
+    return {
+        "response_cache": response_cache.stats(),
+        "post_count_cache": post_count_cache.stats(),
+        "principal_cache": principal_cache.stats(),
+        "token_cache": token_cache.stats(),
+        "password_hasher": password_hasher.stats(),
+        "token_sweeper": token_sweeper.stats()
+    }
\ No newline at end of file
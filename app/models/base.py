@@ -13,8 +13,15 @@ class Base(DeclarativeBase):
 class BaseModel(Base):
     """Базовая модель с общими полями"""
     __abstract__ = True
+    # Серверные значения (created_at, updated_at) возвращаются через RETURNING того же INSERT/UPDATE
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True),server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True),onupdate=func.now(),nullable=True)
-    is_active: Mapped[bool] = mapped_column(default=True)
\ No newline at end of file
+    is_active: Mapped[bool] = mapped_column(default=True)
+
+    def __init__(self, **kwargs):
+        # updated_at известен заранее (NULL до первого изменения), поэтому после INSERT его не нужно дочитывать
+        kwargs.setdefault("updated_at", None)
+        super().__init__(**kwargs)
@@ -1,4 +1,5 @@
-from sqlalchemy import String, Text, Boolean, ForeignKey
+from sqlalchemy import String, Text, Boolean, ForeignKey, Index, DDL, event, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import bleach
 from .base import BaseModel
@@ -14,12 +15,18 @@ class Post(BaseModel):
     excerpt: Mapped[str] = mapped_column(Text, nullable=True)
     content: Mapped[str] = mapped_column(Text, nullable=False)
     is_published: Mapped[bool] = mapped_column(Boolean, default=False)
+    # Заполняется триггером posts_search_vector_update (PostgreSQL); в SQLite поиск идет через FTS5
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR().with_variant(Text, "sqlite"),
+        nullable=True,
+        deferred=True
+    )
 
     category_id: Mapped[int] = mapped_column(ForeignKey("categories.id"))
-    author_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+    author_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
 
-    category: Mapped["Category"] = relationship("Category", back_populates="posts", lazy="selectin")
-    author: Mapped["User"] = relationship("User", lazy="selectin")
+    category: Mapped["Category"] = relationship("Category", back_populates="posts", lazy="raise")
+    author: Mapped["User"] = relationship("User", lazy="raise")
 
     def __repr__(self) -> str:
         return f"<Post {self.title}>"
@@ -36,4 +43,45 @@ class Post(BaseModel):
             tags=allowed_tags,
             attributes=allowed_attributes,
             strip=True
-        )
\ No newline at end of file
+        )
+
+
+Index(
+    "ix_posts_published_created_at",
+    Post.created_at.desc(),
+    Post.id.desc(),
+    postgresql_where=text("is_published AND is_active")
+)
+Index(
+    "ix_posts_category_published_created_at",
+    Post.category_id,
+    Post.created_at.desc(),
+    Post.id.desc(),
+    postgresql_where=text("is_published AND is_active")
+)
+Index(
+    "ix_posts_search_vector",
+    Post.search_vector,
+    postgresql_using="gin"
+).ddl_if(dialect="postgresql")
+
+# Триггер search_vector для баз, созданных через create_all (в миграциях - 130838c7007a)
+for statement in (
+    """
+    CREATE FUNCTION posts_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('simple'::regconfig, coalesce(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('simple'::regconfig, coalesce(NEW.excerpt, '')), 'B') ||
+            setweight(to_tsvector('simple'::regconfig, coalesce(NEW.content, '')), 'C');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER posts_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, excerpt, content ON posts
+    FOR EACH ROW EXECUTE FUNCTION posts_search_vector_update()
+    """,
+):
+    event.listen(Post.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql"))
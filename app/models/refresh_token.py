@@ -1,4 +1,4 @@
-from sqlalchemy import String, DateTime, ForeignKey
+from sqlalchemy import LargeBinary, DateTime, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
 from .base import BaseModel
@@ -9,11 +9,12 @@ class RefreshToken(BaseModel):
 
     __tablename__ = "refresh_tokens"
 
-    token: Mapped[str] = mapped_column(String(512), unique=True, index=True)
-    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+    # SHA-256 токена: компактный уникальный индекс вместо полного JWT
+    token_hash: Mapped[bytes] = mapped_column(LargeBinary(32), unique=True, index=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
 
     user: Mapped["User"] = relationship("User", back_populates="refresh_tokens")
 
     def __repr__(self) -> str:
-        return f"<RefreshToken {self.token[:10]}...>"
\ No newline at end of file
+        return f"<RefreshToken {self.token_hash.hex()[:10]}...>"
\ No newline at end of file
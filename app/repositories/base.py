@@ -1,16 +1,57 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Type, Optional, List
+from typing import Generic, TypeVar, Type, Optional, List, Tuple, Iterable, Dict, AsyncIterator
+from datetime import datetime
+from sqlalchemy import inspect, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.repositories.loaders import LoadProfile
 
 ModelType = TypeVar('ModelType')
 
 
+def is_unique_violation(error: IntegrityError, table: str, column: str) -> bool:
+    """Нарушение уникального индекса колонки (SQLite: "table.column", PostgreSQL: индекс ix_table_column)"""
+    message = str(error.orig)
+    return f"{table}.{column}" in message or f"ix_{table}_{column}" in message
+
+
 class BaseRepository(Generic[ModelType], ABC):
     """Абстрактный базовый репозиторий с CRUD операциями"""
 
+    _model: Type[ModelType]
+
     def __init__(self, db_session: AsyncSession):
         self._db_session = db_session
 
+    def _validate_fields(self, fields: Iterable[str]) -> None:
+        """Проверить, что поля являются изменяемыми колонками модели (ValueError для неизвестных)"""
+        allowed = set(inspect(self._model).column_attrs.keys()) - {"id"}
+        unknown = set(fields) - allowed
+        if unknown:
+            raise ValueError(f"Unknown fields for {self._model.__name__}: {', '.join(sorted(unknown))}")
+
+    async def _update_returning(self, item_id: int, values: dict) -> Optional[ModelType]:
+        """UPDATE ... WHERE id = :id RETURNING одним запросом (None, если строки нет)"""
+        self._validate_fields(values)
+        result = await self._db_session.execute(
+            update(self._model)
+            .where(self._model.id == item_id)
+            .values(**values)
+            .returning(self._model)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
+    async def _soft_delete(self, item_id: int) -> bool:
+        """Пометить строку неактивной одним UPDATE (False, если строки нет)"""
+        result = await self._db_session.execute(
+            update(self._model)
+            .where(self._model.id == item_id)
+            .values(is_active=False)
+            .returning(self._model.id)
+        )
+        return result.scalar_one_or_none() is not None
+
     @abstractmethod
     async def get_by_id(self, item_id: int) -> Optional[ModelType]:
         """Получить сущность по ID"""
@@ -45,6 +86,11 @@ class UserRepositoryInterface(BaseRepository[ModelType], ABC):
         """Получить пользователя по email"""
         pass
 
+    @abstractmethod
+    async def get_by_email_with_roles(self, email: str) -> Optional[ModelType]:
+        """Получить пользователя по email вместе с ролями"""
+        pass
+
     @abstractmethod
     async def email_exists(self, email: str) -> bool:
         """Проверить существование email"""
@@ -55,6 +101,11 @@ class UserRepositoryInterface(BaseRepository[ModelType], ABC):
         """Получить пользователя с ролями"""
         pass
 
+    @abstractmethod
+    def stream_all(self, batch_size: int) -> AsyncIterator[List[ModelType]]:
+        """Все пользователи пачками через серверный курсор"""
+        pass
+
 
 class RoleRepositoryInterface(BaseRepository[ModelType], ABC):
     """Абстрактный репозиторий для ролей"""
@@ -88,18 +139,60 @@ class PostRepositoryInterface(BaseRepository[ModelType], ABC):
     """Абстрактный репозиторий для постов"""
 
     @abstractmethod
-    async def get_by_slug(self, slug: str) -> Optional[ModelType]:
+    async def get_by_slug(self, slug: str, profile: LoadProfile = LoadProfile.DETAIL) -> Optional[ModelType]:
         """Получить пост по slug"""
         pass
 
     @abstractmethod
-    async def get_published_posts(self, skip: int = 0, limit: int = 100) -> List[ModelType]:
+    async def get_published_posts(
+            self,
+            skip: int = 0,
+            limit: int = 100,
+            cursor: Optional[Tuple[datetime, int]] = None,
+            profile: LoadProfile = LoadProfile.LIST,
+            category_id: Optional[int] = None
+    ) -> List[ModelType]:
         """Получить опубликованные посты"""
         pass
 
     @abstractmethod
-    async def get_posts_by_category(self, category_slug: str, skip: int = 0, limit: int = 100) -> List[ModelType]:
-        """Получить посты по категории"""
+    async def search_published_posts(
+            self,
+            query: str,
+            limit: int = 100,
+            cursor: Optional[Tuple[float, int]] = None
+    ) -> List[Tuple[ModelType, float]]:
+        """Полнотекстовый поиск по опубликованным постам"""
+        pass
+
+    @abstractmethod
+    async def count_published(self, category_id: Optional[int] = None) -> Optional[int]:
+        """Подсчитать опубликованные посты"""
+        pass
+
+    @abstractmethod
+    async def count_all(self) -> Optional[int]:
+        """Подсчитать все посты"""
+        pass
+
+    @abstractmethod
+    async def estimate_count(self) -> Optional[int]:
+        """Оценить число постов по статистике планировщика"""
+        pass
+
+    @abstractmethod
+    def stream_all(self, batch_size: int) -> AsyncIterator[List[ModelType]]:
+        """Все посты пачками через серверный курсор"""
+        pass
+
+    @abstractmethod
+    async def bulk_create(self, rows: List[dict]) -> Dict[str, int]:
+        """Вставить посты пачкой, пропуская занятые slug (slug -> id вставленных)"""
+        pass
+
+    @abstractmethod
+    async def load_relations(self, post: ModelType) -> ModelType:
+        """Загрузить автора и категорию сохраненного поста"""
         pass
 
     @abstractmethod
@@ -122,6 +215,26 @@ class RefreshTokenRepositoryInterface(BaseRepository[ModelType], ABC):
         pass
 
     @abstractmethod
-    async def delete_expired_tokens(self) -> int:
-        """Удалить просроченные токены"""
+    async def consume(self, token: str) -> Optional[int]:
+        """Погасить действующий токен и вернуть ID его пользователя"""
+        pass
+
+    @abstractmethod
+    async def is_consumed(self, token: str) -> bool:
+        """Был ли токен уже погашен ротацией"""
+        pass
+
+    @abstractmethod
+    async def delete_by_user(self, user_id: int) -> int:
+        """Удалить все токены пользователя"""
+        pass
+
+    @abstractmethod
+    async def trim_user_tokens(self, user_id: int, keep: int, keep_consumed: int) -> int:
+        """Оставить пользователю только keep самых новых действующих токенов и keep_consumed погашенных"""
+        pass
+
+    @abstractmethod
+    async def delete_expired_tokens(self, batch_size: int = 1000) -> int:
+        """Удалить пачку просроченных токенов"""
         pass
\ No newline at end of file
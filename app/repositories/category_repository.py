@@ -1,7 +1,7 @@
 from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 import logging
 from app.models.category import Category
 from app.repositories.base import CategoryRepositoryInterface
@@ -84,12 +84,11 @@ class CategoryRepository(CategoryRepositoryInterface[Category]):
     async def update(self, category_id: int, **kwargs) -> Optional[Category]:
         """Обновить категорию"""
         try:
-            category = await self.get_by_id(category_id)
-            if category:
-                for key, value in kwargs.items():
-                    if hasattr(category, key):
-                        setattr(category, key, value)
-            return category
+            if not kwargs:
+                return await self.get_by_id(category_id)
+            return await self._update_returning(category_id, kwargs)
+        except IntegrityError:
+            raise
         except SQLAlchemyError as error:
             logger.error(f"Error updating category {category_id}: {error}")
             return None
@@ -97,11 +96,7 @@ class CategoryRepository(CategoryRepositoryInterface[Category]):
     async def delete(self, category_id: int) -> bool:
         """Удалить категорию (soft delete)"""
         try:
-            category = await self.get_by_id(category_id)
-            if category:
-                category.is_active = False
-                return True
-            return False
+            return await self._soft_delete(category_id)
         except SQLAlchemyError as error:
             logger.error(f"Error deleting category {category_id}: {error}")
             return False
\ No newline at end of file
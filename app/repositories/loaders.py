@@ -0,0 +1,34 @@
+from enum import Enum
+from sqlalchemy.orm import joinedload, selectinload, load_only, raiseload
+from app.models.post import Post
+from app.models.user import User
+
+
+class LoadProfile(str, Enum):
+    """Профили загрузки отношений поста"""
+    EXISTENCE = "existence"  # только строка поста, без отношений
+    SUMMARY = "summary"      # поля краткой схемы, без content и отношений
+    DETAIL = "detail"        # один пост: автор и категория через JOIN
+    LIST = "list"            # список: авторы и категории общими запросами IN
+
+
+def post_load_options(profile: LoadProfile, entity=Post) -> tuple:
+    """Опции загрузки поста (или его псевдонима) для профиля"""
+    if profile == LoadProfile.EXISTENCE:
+        return raiseload(entity.author), raiseload(entity.category)
+
+    if profile == LoadProfile.SUMMARY:
+        return (
+            load_only(
+                entity.title, entity.slug, entity.excerpt, entity.is_published,
+                entity.category_id, entity.author_id, entity.created_at, entity.updated_at, entity.is_active
+            ),
+            raiseload(entity.author),
+            raiseload(entity.category)
+        )
+
+    # Роли автора в ответах поста не используются
+    if profile == LoadProfile.DETAIL:
+        return joinedload(entity.author).raiseload(User.roles), joinedload(entity.category)
+
+    return selectinload(entity.author).raiseload(User.roles), selectinload(entity.category)
@@ -1,15 +1,26 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple, Dict, AsyncIterator
+from datetime import datetime
+from sqlalchemy import Select, tuple_, func, text, literal_column, table, column
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import raiseload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 import logging
 from app.models.post import Post
 from app.models.category import Category
+from app.models.user import User
 from app.repositories.base import PostRepositoryInterface
+from app.repositories.loaders import LoadProfile, post_load_options
 
 logger = logging.getLogger(__name__)
 
+SEARCH_CONFIG = "simple"
+SEARCH_WEIGHTS = (10.0, 5.0, 1.0)
+
+# Виртуальная таблица FTS5, заменяющая search_vector в SQLite (см. tests/conftest.py)
+posts_fts = table("posts_fts", column("rowid"))
+
 
 class PostRepository(PostRepositoryInterface[Post]):
     """Конкретная реализация репозитория постов (только данные)"""
@@ -18,53 +29,38 @@ class PostRepository(PostRepositoryInterface[Post]):
         super().__init__(db_session)
         self._model = Post
 
-    async def get_by_id(self, post_id: int) -> Optional[Post]:
-        """Получить пост по ID с предзагрузкой отношений"""
+    async def get_by_id(self, post_id: int, profile: LoadProfile = LoadProfile.DETAIL) -> Optional[Post]:
+        """Получить пост по ID с отношениями согласно профилю загрузки"""
         try:
-            from sqlalchemy.orm import selectinload
-
             result = await self._db_session.execute(
                 select(Post)
-                .options(
-                    selectinload(Post.author),
-                    selectinload(Post.category)
-                )
+                .options(*post_load_options(profile))
                 .where(Post.id == post_id)
             )
-            return result.scalar_one_or_none()
+            return result.unique().scalar_one_or_none()
         except SQLAlchemyError as error:
             logger.error(f"Error getting post by id {post_id}: {error}")
             return None
 
-    async def get_by_slug(self, slug: str) -> Optional[Post]:
-        """Получить пост по slug с предзагрузкой отношений"""
+    async def get_by_slug(self, slug: str, profile: LoadProfile = LoadProfile.DETAIL) -> Optional[Post]:
+        """Получить пост по slug с отношениями согласно профилю загрузки"""
         try:
-            from sqlalchemy.orm import selectinload
-
             result = await self._db_session.execute(
                 select(Post)
-                .options(
-                    selectinload(Post.author),
-                    selectinload(Post.category)
-                )
+                .options(*post_load_options(profile))
                 .where(Post.slug == slug)
             )
-            return result.scalar_one_or_none()
+            return result.unique().scalar_one_or_none()
         except SQLAlchemyError as error:
             logger.error(f"Error getting post by slug {slug}: {error}")
             return None
 
-    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Post]:
-        """Получить все посты с предзагрузкой отношений"""
+    async def get_all(self, skip: int = 0, limit: int = 100, profile: LoadProfile = LoadProfile.LIST) -> List[Post]:
+        """Получить все посты с отношениями согласно профилю загрузки"""
         try:
-            from sqlalchemy.orm import selectinload
-
             result = await self._db_session.execute(
                 select(Post)
-                .options(
-                    selectinload(Post.author),
-                    selectinload(Post.category)
-                )
+                .options(*post_load_options(profile))
                 .offset(skip)
                 .limit(limit)
             )
@@ -73,52 +69,137 @@ class PostRepository(PostRepositoryInterface[Post]):
             logger.error(f"Error getting all posts: {error}")
             return []
 
-    async def get_published_posts(self, skip: int = 0, limit: int = 100) -> List[Post]:
-        """Получить опубликованные посты с предзагрузкой отношений"""
-        try:
-            from sqlalchemy.orm import selectinload
+    async def get_published_posts(
+            self,
+            skip: int = 0,
+            limit: int = 100,
+            cursor: Optional[Tuple[datetime, int]] = None,
+            profile: LoadProfile = LoadProfile.LIST,
+            category_id: Optional[int] = None
+    ) -> List[Post]:
+        """Получить опубликованные посты (всей ленты или одной категории)
 
-            result = await self._db_session.execute(
+        При переданном курсоре (created_at, id) вместо OFFSET используется
+        keyset-пагинация: стоимость страницы не зависит от ее номера.
+        """
+        try:
+            stmt = (
                 select(Post)
-                .options(
-                    selectinload(Post.author),
-                    selectinload(Post.category)
-                )
+                .options(*post_load_options(profile))
                 .where(Post.is_published == True)
                 .where(Post.is_active == True)
-                .offset(skip)
-                .limit(limit)
-                .order_by(Post.created_at.desc())
             )
+            if category_id is not None:
+                stmt = stmt.where(Post.category_id == category_id)
+            result = await self._db_session.execute(self._paginate(stmt, skip, limit, cursor))
             return result.scalars().all()
         except SQLAlchemyError as error:
             logger.error(f"Error getting published posts: {error}")
             return []
 
-    async def get_posts_by_category(self, category_slug: str, skip: int = 0, limit: int = 100) -> List[Post]:
-        """Получить посты по категории с предзагрузкой отношений"""
-        try:
-            from sqlalchemy.orm import selectinload
+    async def search_published_posts(
+            self,
+            query: str,
+            limit: int = 100,
+            cursor: Optional[Tuple[float, int]] = None
+    ) -> List[Tuple[Post, float]]:
+        """Полнотекстовый поиск по опубликованным постам в порядке релевантности
 
-            result = await self._db_session.execute(
-                select(Post)
-                .join(Category)
-                .options(
-                    selectinload(Post.author),
-                    selectinload(Post.category)
+        В PostgreSQL используется колонка search_vector (заполняется триггером) с GIN-индексом,
+        в SQLite - виртуальная таблица FTS5 posts_fts. Курсор - пара (rank, id).
+        """
+        try:
+            if self._db_session.get_bind().dialect.name == "postgresql":
+                search_vector = Post.search_vector
+                ts_query = func.websearch_to_tsquery(literal_column(f"'{SEARCH_CONFIG}'::regconfig"), query)
+                rank = func.ts_rank(search_vector, ts_query)
+                stmt = select(Post, rank).where(search_vector.op("@@")(ts_query))
+            else:
+                match = self._fts_match_expression(query)
+                if not match:
+                    return []
+                fts_table = literal_column(posts_fts.name)
+                # bm25() возвращает меньшие значения для более релевантных строк
+                rank = -func.bm25(fts_table, *SEARCH_WEIGHTS)
+                stmt = (
+                    select(Post, rank)
+                    .join(posts_fts, posts_fts.c.rowid == Post.id)
+                    .where(fts_table.op("MATCH")(match))
                 )
-                .where(Category.slug == category_slug)
+
+            stmt = (
+                stmt.options(*post_load_options(LoadProfile.SUMMARY))
                 .where(Post.is_published == True)
                 .where(Post.is_active == True)
-                .offset(skip)
+                .order_by(rank.desc(), Post.id.desc())
                 .limit(limit)
-                .order_by(Post.created_at.desc())
             )
-            return result.scalars().all()
+            if cursor:
+                stmt = stmt.where(tuple_(rank, Post.id) < tuple_(*cursor))
+
+            result = await self._db_session.execute(stmt)
+            return [(post, float(post_rank)) for post, post_rank in result.all()]
         except SQLAlchemyError as error:
-            logger.error(f"Error getting posts by category {category_slug}: {error}")
+            logger.error(f"Error searching posts by query {query!r}: {error}")
             return []
 
+    @staticmethod
+    def _fts_match_expression(query: str) -> str:
+        """Запрос FTS5 из слов строки поиска (каждое слово экранируется как фраза)"""
+        terms = [term.replace('"', '""') for term in query.split()]
+        return " ".join(f'"{term}"' for term in terms)
+
+    @staticmethod
+    def _paginate(stmt: Select, skip: int, limit: int, cursor: Optional[Tuple[datetime, int]]) -> Select:
+        """Упорядочить ленту по (created_at, id) и применить курсор либо OFFSET"""
+        stmt = stmt.order_by(Post.created_at.desc(), Post.id.desc()).limit(limit)
+        if cursor:
+            return stmt.where(tuple_(Post.created_at, Post.id) < tuple_(*cursor))
+        return stmt.offset(skip)
+
+    async def count_published(self, category_id: Optional[int] = None) -> Optional[int]:
+        """Подсчитать опубликованные посты (всей ленты или одной категории)"""
+        try:
+            stmt = (
+                select(func.count())
+                .select_from(Post)
+                .where(Post.is_published == True)
+                .where(Post.is_active == True)
+            )
+            if category_id is not None:
+                stmt = stmt.where(Post.category_id == category_id)
+
+            result = await self._db_session.execute(stmt)
+            return result.scalar_one()
+        except SQLAlchemyError as error:
+            logger.error(f"Error counting published posts for category {category_id}: {error}")
+            return None
+
+    async def count_all(self) -> Optional[int]:
+        """Подсчитать все посты"""
+        try:
+            result = await self._db_session.execute(select(func.count()).select_from(Post))
+            return result.scalar_one()
+        except SQLAlchemyError as error:
+            logger.error(f"Error counting posts: {error}")
+            return None
+
+    async def estimate_count(self) -> Optional[int]:
+        """Оценить число постов по pg_class.reltuples (только PostgreSQL, без сканирования таблицы)"""
+        if self._db_session.get_bind().dialect.name != "postgresql":
+            return None
+
+        try:
+            result = await self._db_session.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+                {"table": Post.__tablename__}
+            )
+            estimate = result.scalar()
+            return estimate if estimate is not None and estimate >= 0 else None
+        except SQLAlchemyError as error:
+            logger.error(f"Error estimating posts count: {error}")
+            return None
+
     async def exists_by_category_id(self, category_id: int) -> bool:
         """Проверить существование постов в категории (чистая операция с данными)"""
         try:
@@ -146,6 +227,52 @@ class PostRepository(PostRepositoryInterface[Post]):
             logger.error(f"Error creating post: {error}")
             return None
 
+    async def stream_all(self, batch_size: int) -> AsyncIterator[List[Post]]:
+        """Все посты пачками через серверный курсор (в памяти не больше одной пачки)"""
+        result = await self._db_session.stream_scalars(
+            select(Post)
+            .options(*post_load_options(LoadProfile.EXISTENCE))
+            .order_by(Post.id)
+            .execution_options(yield_per=batch_size)
+        )
+        async for batch in result.partitions():
+            yield batch
+
+    async def bulk_create(self, rows: List[dict]) -> Dict[str, int]:
+        """Вставить посты одним многострочным INSERT, пропуская занятые slug
+
+        Возвращает slug -> id вставленных строк; ошибки БД передаются вызывающему.
+        """
+        if not rows:
+            return {}
+
+        if self._db_session.get_bind().dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+
+        result = await self._db_session.execute(
+            insert(Post)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=[Post.slug])
+            .returning(Post.slug, Post.id)
+        )
+        return dict(result.all())
+
+    async def load_relations(self, post: Post) -> Post:
+        """Загрузить автора и категорию сохраненного поста одним запросом"""
+        result = await self._db_session.execute(
+            select(User, Category)
+            .join_from(User, Category, Category.id == post.category_id)
+            .options(raiseload(User.roles))
+            .where(User.id == post.author_id)
+        )
+        row = result.one_or_none()
+        if row:
+            set_committed_value(post, "author", row.User)
+            set_committed_value(post, "category", row.Category)
+        return post
+
     async def create_with_author(self, author_id: int, **kwargs) -> Optional[Post]:
         """Создать пост с автором"""
         try:
@@ -159,12 +286,11 @@ class PostRepository(PostRepositoryInterface[Post]):
     async def update(self, post_id: int, **kwargs) -> Optional[Post]:
         """Обновить пост"""
         try:
-            post = await self.get_by_id(post_id)
-            if post:
-                for key, value in kwargs.items():
-                    if hasattr(post, key):
-                        setattr(post, key, value)
-            return post
+            if not kwargs:
+                return await self.get_by_id(post_id, profile=LoadProfile.EXISTENCE)
+            return await self._update_returning(post_id, kwargs)
+        except IntegrityError:
+            raise
         except SQLAlchemyError as error:
             logger.error(f"Error updating post {post_id}: {error}")
             return None
@@ -172,11 +298,7 @@ class PostRepository(PostRepositoryInterface[Post]):
     async def delete(self, post_id: int) -> bool:
         """Удалить пост (soft delete)"""
         try:
-            post = await self.get_by_id(post_id)
-            if post:
-                post.is_active = False
-                return True
-            return False
+            return await self._soft_delete(post_id)
         except SQLAlchemyError as error:
             logger.error(f"Error deleting post {post_id}: {error}")
             return False
\ No newline at end of file
@@ -1,9 +1,11 @@
 from typing import Optional, List
 from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, exists, update, or_, ScalarSelect
 from sqlalchemy.future import select
 from sqlalchemy.exc import SQLAlchemyError
 import logging
+from app.core.security import SecurityService
 from app.models.refresh_token import RefreshToken
 from app.repositories.base import RefreshTokenRepositoryInterface
 
@@ -29,16 +31,56 @@ class RefreshTokenRepository(RefreshTokenRepositoryInterface[RefreshToken]):
             return None
 
     async def get_by_token(self, token: str) -> Optional[RefreshToken]:
-        """Получить токен по значению"""
+        """Получить токен по значению (поиск по SHA-256)"""
         try:
             result = await self._db_session.execute(
-                select(RefreshToken).where(RefreshToken.token == token)
+                select(RefreshToken).where(RefreshToken.token_hash == SecurityService.token_digest(token))
             )
             return result.scalar_one_or_none()
         except SQLAlchemyError as error:
             logger.error(f"Error getting token by value: {error}")
             return None
 
+    async def consume(self, token: str) -> Optional[int]:
+        """Погасить действующий токен и вернуть ID его пользователя (None, если токена нет)
+
+        UPDATE ... RETURNING атомарен: из двух параллельных обновлений одним токеном
+        пользователя получит только одно. Погашенная строка (is_active = false) остается
+        до истечения срока как отметка для распознавания повторного использования.
+        Ошибки БД пробрасываются, чтобы сервис откатил ротацию целиком.
+        """
+        result = await self._db_session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.token_hash == SecurityService.token_digest(token))
+            .where(RefreshToken.is_active == True)
+            .where(RefreshToken.expires_at > datetime.now(timezone.utc))
+            .values(is_active=False)
+            .returning(RefreshToken.user_id)
+            .execution_options(synchronize_session=False)
+        )
+        return result.scalar_one_or_none()
+
+    async def is_consumed(self, token: str) -> bool:
+        """Был ли токен уже погашен ротацией"""
+        result = await self._db_session.execute(
+            select(
+                exists().where(
+                    RefreshToken.token_hash == SecurityService.token_digest(token),
+                    RefreshToken.is_active == False
+                )
+            )
+        )
+        return result.scalar()
+
+    async def delete_by_user(self, user_id: int) -> int:
+        """Удалить все токены пользователя"""
+        result = await self._db_session.execute(
+            delete(RefreshToken)
+            .where(RefreshToken.user_id == user_id)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[RefreshToken]:
         """Получить все токены"""
         try:
@@ -85,20 +127,49 @@ class RefreshTokenRepository(RefreshTokenRepositoryInterface[RefreshToken]):
             logger.error(f"Error deleting token {token_id}: {error}")
             return False
 
-    async def delete_expired_tokens(self) -> int:
-        """Удалить просроченные токены"""
-        try:
-            current_time = datetime.now(timezone.utc)
-            result = await self._db_session.execute(
-                select(RefreshToken).where(RefreshToken.expires_at < current_time)
-            )
-            expired_tokens = result.scalars().all()
+    async def trim_user_tokens(self, user_id: int, keep: int, keep_consumed: int) -> int:
+        """Оставить пользователю keep самых новых действующих токенов и keep_consumed
+        самых новых отметок погашенных, удалив остальные одним запросом
 
-            for token in expired_tokens:
-                await self._db_session.delete(token)
+        Лимиты считаются раздельно: отметки не вытесняют действующие токены, но и
+        не копятся при каждой ротации до истечения срока.
+        """
+        result = await self._db_session.execute(
+            delete(RefreshToken)
+            .where(or_(
+                RefreshToken.id.in_(self._surplus_ids(user_id, True, keep)),
+                RefreshToken.id.in_(self._surplus_ids(user_id, False, keep_consumed))
+            ))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
 
-            await self._db_session.commit()
-            return len(expired_tokens)
-        except SQLAlchemyError as error:
-            logger.error(f"Error deleting expired tokens: {error}")
-            return 0
\ No newline at end of file
+    @staticmethod
+    def _surplus_ids(user_id: int, is_active: bool, keep: int) -> ScalarSelect:
+        """ID токенов пользователя с данным is_active, кроме keep самых новых"""
+        return (
+            select(RefreshToken.id)
+            .where(RefreshToken.user_id == user_id)
+            .where(RefreshToken.is_active == is_active)
+            .order_by(RefreshToken.id.desc())
+            .offset(keep)
+            .scalar_subquery()
+        )
+
+    async def delete_expired_tokens(self, batch_size: int = 1000) -> int:
+        """Удалить пачку просроченных токенов одним запросом
+
+        commit выполняет вызывающий; ошибки БД передаются ему, чтобы сбой очистки был виден в счетчиках.
+        """
+        expired_ids = (
+            select(RefreshToken.id)
+            .where(RefreshToken.expires_at < datetime.now(timezone.utc))
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        result = await self._db_session.execute(
+            delete(RefreshToken)
+            .where(RefreshToken.id.in_(expired_ids))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
@@ -1,7 +1,7 @@
 from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 import logging
 from app.models.role import Role
 from app.repositories.base import RoleRepositoryInterface
@@ -62,12 +62,11 @@ class RoleRepository(RoleRepositoryInterface[Role]):
     async def update(self, role_id: int, **kwargs) -> Optional[Role]:
         """Обновить роль"""
         try:
-            role = await self.get_by_id(role_id)
-            if role:
-                for key, value in kwargs.items():
-                    if hasattr(role, key):
-                        setattr(role, key, value)
-            return role
+            if not kwargs:
+                return await self.get_by_id(role_id)
+            return await self._update_returning(role_id, kwargs)
+        except IntegrityError:
+            raise
         except SQLAlchemyError as error:
             logger.error(f"Error updating role {role_id}: {error}")
             return None
@@ -75,11 +74,7 @@ class RoleRepository(RoleRepositoryInterface[Role]):
     async def delete(self, role_id: int) -> bool:
         """Удалить роль (soft delete)"""
         try:
-            role = await self.get_by_id(role_id)
-            if role:
-                role.is_active = False
-                return True
-            return False
+            return await self._soft_delete(role_id)
         except SQLAlchemyError as error:
             logger.error(f"Error deleting role {role_id}: {error}")
             return False
\ No newline at end of file
@@ -1,8 +1,8 @@
-from typing import Optional, List
+from typing import Optional, List, AsyncIterator
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import joinedload, raiseload
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 import logging
 from app.models.user import User
 from app.repositories.base import UserRepositoryInterface
@@ -39,6 +39,19 @@ class UserRepository(UserRepositoryInterface[User]):
             logger.error(f"Error getting user by email {email}: {error}")
             return None
 
+    async def get_by_email_with_roles(self, email: str) -> Optional[User]:
+        """Получить пользователя по email вместе с ролями одним запросом"""
+        try:
+            result = await self._db_session.execute(
+                select(User)
+                .options(joinedload(User.roles))
+                .where(User.email == email)
+            )
+            return result.unique().scalar_one_or_none()
+        except SQLAlchemyError as error:
+            logger.error(f"Error getting user with roles by email {email}: {error}")
+            return None
+
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[User]:
         """Получить всех пользователей"""
         try:
@@ -50,22 +63,26 @@ class UserRepository(UserRepositoryInterface[User]):
             logger.error(f"Error getting all users: {error}")
             return []
 
+    async def stream_all(self, batch_size: int) -> AsyncIterator[List[User]]:
+        """Все пользователи пачками через серверный курсор (без ролей)"""
+        result = await self._db_session.stream_scalars(
+            select(User)
+            .options(raiseload(User.roles))
+            .order_by(User.id)
+            .execution_options(yield_per=batch_size)
+        )
+        async for batch in result.partitions():
+            yield batch
+
     async def get_with_roles(self, user_id: int) -> Optional[User]:
-        """Получить пользователя с ролями"""
+        """Получить пользователя с ролями одним запросом"""
         try:
-            from sqlalchemy.orm import selectinload
-
             result = await self._db_session.execute(
                 select(User)
-                .options(selectinload(User.roles))
+                .options(joinedload(User.roles))
                 .where(User.id == user_id)
             )
-            user = result.scalar_one_or_none()
-
-            if user and hasattr(user, 'roles'):
-                _ = user.roles
-
-            return user
+            return result.unique().scalar_one_or_none()
         except SQLAlchemyError as error:
             logger.error(f"Error getting user with roles {user_id}: {error}")
             return None
@@ -94,12 +111,11 @@ class UserRepository(UserRepositoryInterface[User]):
     async def update(self, user_id: int, **kwargs) -> Optional[User]:
         """Обновить пользователя"""
         try:
-            user = await self.get_by_id(user_id)
-            if user:
-                for key, value in kwargs.items():
-                    if hasattr(user, key):
-                        setattr(user, key, value)
-            return user
+            if not kwargs:
+                return await self.get_by_id(user_id)
+            return await self._update_returning(user_id, kwargs)
+        except IntegrityError:
+            raise
         except SQLAlchemyError as error:
             logger.error(f"Error updating user {user_id}: {error}")
             return None
@@ -107,11 +123,7 @@ class UserRepository(UserRepositoryInterface[User]):
     async def delete(self, user_id: int) -> bool:
         """Удалить пользователя (soft delete)"""
         try:
-            user = await self.get_by_id(user_id)
-            if user:
-                user.is_active = False
-                return True
-            return False
+            return await self._soft_delete(user_id)
         except SQLAlchemyError as error:
             logger.error(f"Error deleting user {user_id}: {error}")
             return False
\ No newline at end of file
@@ -81,9 +81,78 @@ class PostResponse(PostBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class PostSummaryResponse(BaseModel):
+    """Краткая схема поста для лент (без содержимого и вложенных объектов)"""
+    id: int
+    title: str
+    slug: str
+    excerpt: Optional[str] = None
+    is_published: bool
+    category_id: int
+    author_id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class PostListResponse(BaseModel):
     """Схема для списка постов"""
     posts: list[PostResponse]
-    total: int
+    total: Optional[int] = None
+    total_is_exact: bool = True
+    skip: int
+    limit: int
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
+
+class PostSummaryListResponse(BaseModel):
+    """Схема для ленты кратких постов"""
+    posts: list[PostSummaryResponse]
+    total: Optional[int] = None
+    total_is_exact: bool = True
     skip: int
-    limit: int
\ No newline at end of file
+    limit: int
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
+
+class PostSearchResponse(BaseModel):
+    """Схема для результатов полнотекстового поиска (по убыванию релевантности)"""
+    posts: list[PostSummaryResponse]
+    limit: int
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
+
+class PostExportRow(BaseModel):
+    """Строка выгрузки поста (поля совместимы с массовым импортом)"""
+    id: int
+    title: str
+    slug: str
+    excerpt: Optional[str] = None
+    content: str
+    is_published: bool
+    category_id: int
+    author_id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    is_active: bool
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PostImportItemResult(BaseModel):
+    """Результат импорта одного поста (index - позиция во входных данных)"""
+    index: int
+    slug: Optional[str] = None
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+
+class PostImportResponse(BaseModel):
+    """Отчет массового импорта постов"""
+    created: int
+    failed: int
+    results: list[PostImportItemResult]
@@ -37,6 +37,12 @@ class UserResponse(UserBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class UserExportRow(UserResponse):
+    """Строка выгрузки пользователя"""
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+
+
 class UserWithRolesResponse(UserResponse):
     """Схема ответа пользователя с ролями"""
     roles: Optional[List[str]] = None
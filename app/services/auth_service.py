@@ -1,14 +1,15 @@
 from typing import Optional, Tuple
 from datetime import datetime, timedelta, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 import logging
 from app.core.security import SecurityService
 from app.core.config import settings
 from app.repositories.base import (
     UserRepositoryInterface,
     RefreshTokenRepositoryInterface,
-    RoleRepositoryInterface
+    RoleRepositoryInterface,
+    is_unique_violation
 )
 from app.schemas.user import LoginRequest, UserCreate
 from app.models.user import User
@@ -36,10 +37,7 @@ class AuthService:
     async def register_user(self, user_data: UserCreate) -> Tuple[bool, Optional[str]]:
         """Регистрация пользователя (бизнес-логика)"""
         try:
-            if await self._user_repository.email_exists(user_data.email):
-                return False, "User with this email already exists"
-
-            password_hash = SecurityService.hash_password(user_data.password)
+            password_hash = await SecurityService.hash_password_async(user_data.password)
 
             user_dict = user_data.model_dump(exclude={'password'})
             user_dict['password_hash'] = password_hash
@@ -57,6 +55,12 @@ class AuthService:
             await self._db_session.commit()
             return True, None
 
+        except IntegrityError as error:
+            await self._db_session.rollback()
+            if is_unique_violation(error, User.__tablename__, "email"):
+                return False, "User with this email already exists"
+            logger.error(f"Integrity error during registration: {error}")
+            return False, "Database error"
         except SQLAlchemyError as error:
             await self._db_session.rollback()
             logger.error(f"Database error during registration: {error}")
@@ -69,21 +73,25 @@ class AuthService:
     async def authenticate_user(self, login_data: LoginRequest) -> Tuple[Optional[dict], Optional[str]]:
         """Аутентификация пользователя (бизнес-логика)"""
         try:
-            user = await self._user_repository.get_by_email(login_data.email)
+            user = await self._user_repository.get_by_email_with_roles(login_data.email)
 
             if not user or not user.is_active:
                 return None, "Invalid credentials"
 
-            if not SecurityService.verify_password(login_data.password, user.password_hash):
+            verified, new_hash = await SecurityService.verify_and_update_password_async(
+                login_data.password, user.password_hash
+            )
+            if not verified:
                 return None, "Invalid credentials"
 
-            user_with_roles = await self._user_repository.get_with_roles(user.id)
-            roles = [role.name for role in user_with_roles.roles] if user_with_roles and user_with_roles.roles else []
+            # Новый хеш сохраняется вместе с refresh токеном в create_tokens
+            if new_hash:
+                user.password_hash = new_hash
 
             user_data = {
                 "sub": str(user.id),
                 "email": user.email,
-                "roles": roles
+                "roles": [role.name for role in user.roles]
             }
 
             return user_data, None
@@ -98,63 +106,55 @@ class AuthService:
     async def create_tokens(self, user_data: dict) -> Optional[dict]:
         """Создание токенов (бизнес-логика)"""
         try:
-            access_token = SecurityService.create_access_token(user_data)
-            refresh_token = SecurityService.create_refresh_token(user_data)
-
-            expires_at = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-
-            token_created = await self._refresh_token_repository.create(
-                token=refresh_token,
-                expires_at=expires_at,
-                user_id=int(user_data["sub"])
-            )
-
-            if token_created:
+            tokens = await self._issue_tokens(user_data)
+            if tokens:
                 await self._db_session.commit()
-                return {
-                    "access_token": access_token,
-                    "refresh_token": refresh_token,
-                    "token_type": "bearer"
-                }
-            return None
+            return tokens
 
         except Exception as error:
+            await self._db_session.rollback()
             logger.error(f"Error creating tokens: {error}")
             return None
 
     async def refresh_tokens(self, refresh_token: str) -> Tuple[Optional[dict], Optional[str]]:
-        """Обновление токенов (бизнес-логика)"""
+        """Ротация refresh токена одной транзакцией (бизнес-логика)
+
+        Старый токен гасится через UPDATE ... RETURNING, новый добавляется в той же
+        транзакции. Повторное предъявление уже погашенного токена считается кражей:
+        все токены пользователя отзываются. Токен, вытесненный лимитом
+        MAX_REFRESH_TOKENS_PER_USER или неизвестный (в том числе погашенный давно,
+        отметка которого вытеснена MAX_CONSUMED_REFRESH_TOKENS_PER_USER), просто отклоняется.
+        """
         try:
-            token_record = await self._refresh_token_repository.get_by_token(refresh_token)
-
-            current_time = datetime.now(timezone.utc)
-
-            if not token_record or token_record.expires_at < current_time:
-                return None, "Invalid or expired refresh token"
-
             payload = SecurityService.verify_token(refresh_token)
             if not payload or payload.get("type") != "refresh":
                 return None, "Invalid token"
 
-            user_id = int(payload["sub"])
+            user_id = await self._refresh_token_repository.consume(refresh_token)
+            if user_id is None:
+                if await self._refresh_token_repository.is_consumed(refresh_token):
+                    revoked = await self._refresh_token_repository.delete_by_user(int(payload["sub"]))
+                    await self._db_session.commit()
+                    logger.warning(f"Refresh token reuse for user {payload['sub']}, revoked {revoked} tokens")
+                return None, "Invalid or expired refresh token"
+
             user = await self._user_repository.get_with_roles(user_id)
             if not user or not user.is_active:
+                await self._db_session.rollback()
                 return None, "User not found"
 
-            roles = [role.name for role in user.roles] if user.roles else []
             user_data = {
                 "sub": str(user.id),
                 "email": user.email,
-                "roles": roles
+                "roles": [role.name for role in user.roles]
             }
 
-            tokens = await self.create_tokens(user_data)
+            tokens = await self._issue_tokens(user_data)
             if not tokens:
+                await self._db_session.rollback()
                 return None, "Failed to create tokens"
 
-            await self._refresh_token_repository.delete(token_record.id)
             await self._db_session.commit()
-
             return tokens, None
 
         except SQLAlchemyError as error:
@@ -162,9 +162,42 @@ class AuthService:
             logger.error(f"Database error during token refresh: {error}")
             return None, "Database error"
         except Exception as error:
+            await self._db_session.rollback()
             logger.error(f"Unexpected error during token refresh: {error}")
             return None, "Token refresh failed"
 
+    async def _issue_tokens(self, user_data: dict) -> Optional[dict]:
+        """Выпустить пару токенов и добавить refresh токен в сессию (без commit)
+
+        Самые старые токены пользователя сверх MAX_REFRESH_TOKENS_PER_USER и отметки
+        погашенных сверх MAX_CONSUMED_REFRESH_TOKENS_PER_USER удаляются в той же транзакции.
+        """
+        user_id = int(user_data["sub"])
+        await self._refresh_token_repository.trim_user_tokens(
+            user_id,
+            keep=max(settings.MAX_REFRESH_TOKENS_PER_USER - 1, 0),
+            keep_consumed=settings.MAX_CONSUMED_REFRESH_TOKENS_PER_USER
+        )
+
+        access_token = SecurityService.create_access_token(user_data)
+        refresh_token = SecurityService.create_refresh_token(user_data)
+
+        expires_at = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+
+        token_created = await self._refresh_token_repository.create(
+            token_hash=SecurityService.token_digest(refresh_token),
+            expires_at=expires_at,
+            user_id=user_id
+        )
+        if not token_created:
+            return None
+
+        return {
+            "access_token": access_token,
+            "refresh_token": refresh_token,
+            "token_type": "bearer"
+        }
+
     async def _assign_default_role(self, user_id: int) -> bool:
         """Назначить роль по умолчанию (внутренняя бизнес-логика)"""
         try:
@@ -1,8 +1,10 @@
 from typing import Optional, List, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 import logging
-from app.repositories.base import CategoryRepositoryInterface, PostRepositoryInterface
+from app.core.cache import response_cache, CATEGORIES_TAG, FEED_TAG, category_tag
+from app.core.category_registry import category_registry
+from app.repositories.base import CategoryRepositoryInterface, PostRepositoryInterface, is_unique_violation
 from app.schemas.category import CategoryCreate, CategoryUpdate
 from app.models.category import Category
 from app.models.post import Post
@@ -23,43 +25,54 @@ class CategoryService:
         self._post_repository = post_repository
         self._db_session = db_session
 
-    async def create_category(self, category_data: CategoryCreate) -> Tuple[bool, Optional[str]]:
-        """Создание категории (бизнес-логика)"""
+    async def create_category(self, category_data: CategoryCreate) -> Tuple[Optional[Category], Optional[str]]:
+        """Создание категории (возвращает сохраненную категорию)"""
         try:
-            if await self._category_repository.slug_exists(category_data.slug):
-                return False, "Category with this slug already exists"
-
             category = await self._category_repository.create(**category_data.model_dump())
             if not category:
-                return False, "Failed to create category"
+                return None, "Failed to create category"
 
             await self._db_session.commit()
-            return True, None
+            response_cache.invalidate_tags(CATEGORIES_TAG)
+            await category_registry.refresh(self._db_session)
+            return category, None
 
+        except IntegrityError as error:
+            await self._db_session.rollback()
+            if is_unique_violation(error, Category.__tablename__, "slug"):
+                return None, "Category with this slug already exists"
+            logger.error(f"Integrity error during category creation: {error}")
+            return None, "Database error"
         except SQLAlchemyError as error:
             await self._db_session.rollback()
             logger.error(f"Database error during category creation: {error}")
-            return False, "Database error"
+            return None, "Database error"
 
-    async def update_category(self, category_id: int, category_data: CategoryUpdate) -> Tuple[bool, Optional[str]]:
-        """Обновление категории (бизнес-логика)"""
+    async def update_category(self, category_id: int, category_data: CategoryUpdate) -> Tuple[Optional[Category], Optional[str]]:
+        """Обновление категории (возвращает сохраненную категорию)"""
         try:
-            if category_data.slug:
-                existing_category = await self._category_repository.get_by_slug(category_data.slug)
-                if existing_category and existing_category.id != category_id:
-                    return False, "Category with this slug already exists"
-
             category = await self._category_repository.update(category_id, **category_data.model_dump(exclude_unset=True))
             if not category:
-                return False, "Category not found"
+                return None, "Category not found"
 
             await self._db_session.commit()
-            return True, None
+            response_cache.invalidate_tags(CATEGORIES_TAG, FEED_TAG, category_tag(category_id))
+            await category_registry.refresh(self._db_session)
+            return category, None
 
+        except IntegrityError as error:
+            await self._db_session.rollback()
+            if is_unique_violation(error, Category.__tablename__, "slug"):
+                return None, "Category with this slug already exists"
+            logger.error(f"Integrity error during category update: {error}")
+            return None, "Database error"
+        except ValueError as error:
+            logger.error(f"Invalid category update: {error}")
+            return None, str(error)
         except SQLAlchemyError as error:
             await self._db_session.rollback()
             logger.error(f"Database error during category update: {error}")
-            return False, "Database error"
+            return None, "Database error"
 
     async def delete_category(self, category_id: int) -> Tuple[bool, Optional[str]]:
         """Удаление категории (бизнес-логика)"""
@@ -77,6 +90,8 @@ class CategoryService:
                 return False, "Failed to delete category"
 
             await self._db_session.commit()
+            response_cache.invalidate_tags(CATEGORIES_TAG, FEED_TAG, category_tag(category_id))
+            await category_registry.refresh(self._db_session)
             return True, None
 
         except SQLAlchemyError as error:
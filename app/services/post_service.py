@@ -1,9 +1,21 @@
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Awaitable, Callable, Hashable, Any, AsyncIterable, List, Set
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 import logging
-from app.repositories.base import PostRepositoryInterface, CategoryRepositoryInterface
-from app.schemas.post import PostCreate, PostUpdate
+from app.core.cache import (
+    post_count_cache,
+    response_cache,
+    FEED_TAG,
+    CATEGORY_FEEDS_TAG,
+    post_tag,
+    category_tag
+)
+from app.core.config import settings
+from app.core.category_registry import category_registry
+from app.core.sanitizer import content_sanitizer
+from app.repositories.base import PostRepositoryInterface, CategoryRepositoryInterface, is_unique_violation
+from app.schemas.post import PostCreate, PostUpdate, PostImportItemResult
 from app.models.post import Post
 from app.models.category import Category
 
@@ -23,16 +35,12 @@ class PostService:
         self._category_repository = category_repository
         self._db_session = db_session
 
-    async def create_post(self, author_id: int, post_data: PostCreate) -> Tuple[bool, Optional[str]]:
-        """Создание поста с санитизацией контента"""
+    async def create_post(self, author_id: int, post_data: PostCreate) -> Tuple[Optional[Post], Optional[str]]:
+        """Создание поста с санитизацией контента (возвращает сохраненный пост с автором и категорией)"""
         try:
-            category = await self._category_repository.get_by_id(post_data.category_id)
+            category = await category_registry.get_by_id(self._db_session, post_data.category_id)
             if not category:
-                return False, "Category not found"
-
-            existing_post = await self._post_repository.get_by_slug(post_data.slug)
-            if existing_post:
-                return False, "Post with this slug already exists"
+                return None, "Category not found"
 
             sanitized_content = Post.sanitize_html(post_data.content)
 
@@ -42,45 +50,63 @@ class PostService:
 
             post = await self._post_repository.create(**post_dict)
             if not post:
-                return False, "Failed to create post"
+                return None, "Failed to create post"
 
             await self._db_session.commit()
-            return True, None
+            self._invalidate_caches(FEED_TAG, category_tag(post_data.category_id))
+            await self._post_repository.load_relations(post)
+            return post, None
 
+        except IntegrityError as error:
+            await self._db_session.rollback()
+            if is_unique_violation(error, Post.__tablename__, "slug"):
+                return None, "Post with this slug already exists"
+            logger.error(f"Integrity error during post creation: {error}")
+            return None, "Database error"
         except SQLAlchemyError as error:
             await self._db_session.rollback()
             logger.error(f"Database error during post creation: {error}")
-            return False, "Database error"
+            return None, "Database error"
 
-    async def update_post(self, post_id: int, post_data: PostUpdate) -> Tuple[bool, Optional[str]]:
-        """Обновление поста с санитизацией контента"""
+    async def update_post(self, post_id: int, post_data: PostUpdate) -> Tuple[Optional[Post], Optional[str]]:
+        """Обновление поста с санитизацией контента (возвращает сохраненный пост с автором и категорией)"""
         try:
             update_data = post_data.model_dump(exclude_unset=True)
 
-            if 'slug' in update_data:
-                existing_post = await self._post_repository.get_by_slug(update_data['slug'])
-                if existing_post and existing_post.id != post_id:
-                    return False, "Post with this slug already exists"
-
             if 'category_id' in update_data:
-                category = await self._category_repository.get_by_id(update_data['category_id'])
+                category = await category_registry.get_by_id(self._db_session, update_data['category_id'])
                 if not category:
-                    return False, "Category not found"
+                    return None, "Category not found"
 
             if 'content' in update_data:
                 update_data['content'] = Post.sanitize_html(update_data['content'])
 
             post = await self._post_repository.update(post_id, **update_data)
             if not post:
-                return False, "Post not found"
+                return None, "Post not found"
 
             await self._db_session.commit()
-            return True, None
+            self._invalidate_caches(
+                FEED_TAG,
+                post_tag(post_id),
+                CATEGORY_FEEDS_TAG if 'category_id' in update_data else category_tag(post.category_id)
+            )
+            await self._post_repository.load_relations(post)
+            return post, None
 
+        except IntegrityError as error:
+            await self._db_session.rollback()
+            if is_unique_violation(error, Post.__tablename__, "slug"):
+                return None, "Post with this slug already exists"
+            logger.error(f"Integrity error during post update: {error}")
+            return None, "Database error"
+        except ValueError as error:
+            logger.error(f"Invalid post update: {error}")
+            return None, str(error)
         except SQLAlchemyError as error:
             await self._db_session.rollback()
             logger.error(f"Database error during post update: {error}")
-            return False, "Database error"
+            return None, "Database error"
 
     async def delete_post(self, post_id: int) -> Tuple[bool, Optional[str]]:
         """Удаление поста"""
@@ -90,9 +116,155 @@ class PostService:
                 return False, "Post not found"
 
             await self._db_session.commit()
+            self._invalidate_caches(FEED_TAG, post_tag(post_id), CATEGORY_FEEDS_TAG)
             return True, None
 
         except SQLAlchemyError as error:
             await self._db_session.rollback()
             logger.error(f"Database error during post deletion: {error}")
-            return False, "Database error"
\ No newline at end of file
+            return False, "Database error"
+
+    async def import_posts(self, author_id: int, items: AsyncIterable[Any]) -> List[PostImportItemResult]:
+        """Массовый импорт постов пачками по BULK_IMPORT_CHUNK_SIZE (результат для каждого элемента)
+
+        Элемент - словарь, строка JSON или ValueError, которым источник сообщает о
+        нечитаемом элементе (например, слишком длинной строке NDJSON). Каждая пачка
+        вставляется одним INSERT и фиксируется отдельно, поэтому ошибка в одной
+        пачке не отменяет остальные.
+        """
+        results: List[PostImportItemResult] = []
+        seen_slugs: Set[str] = set()
+        chunk: List[Tuple[int, PostCreate]] = []
+        index = 0
+
+        async for raw in items:
+            try:
+                post_data = self._parse_import_item(raw)
+            except ValidationError as error:
+                results.append(PostImportItemResult(index=index, error=self._format_validation_error(error)))
+            except ValueError as error:
+                results.append(PostImportItemResult(index=index, error=str(error)))
+            else:
+                if post_data.slug in seen_slugs:
+                    results.append(PostImportItemResult(index=index, slug=post_data.slug, error="Duplicate slug in import"))
+                else:
+                    seen_slugs.add(post_data.slug)
+                    chunk.append((index, post_data))
+            index += 1
+
+            if len(chunk) >= settings.BULK_IMPORT_CHUNK_SIZE:
+                results.extend(await self._import_chunk(author_id, chunk))
+                chunk = []
+
+        if chunk:
+            results.extend(await self._import_chunk(author_id, chunk))
+
+        results.sort(key=lambda result: result.index)
+        return results
+
+    async def get_published_total(self, category_id: Optional[int] = None) -> Tuple[Optional[int], bool]:
+        """Число опубликованных постов ленты или категории (из кэша счетчиков; None, если подсчет не удался)
+
+        Всегда результат COUNT(*), поэтому помечается точным; устаревание кэша
+        ограничено TTL и сбросом при записи.
+        """
+        total = await self._cached_count(
+            ("published", category_id),
+            lambda: self._post_repository.count_published(category_id)
+        )
+        return total, True
+
+    async def get_total(self) -> Tuple[Optional[int], bool]:
+        """Общее число постов; в приближенном режиме для больших таблиц - оценка планировщика"""
+        if settings.POST_COUNT_APPROXIMATE:
+            estimate = await self._cached_count(("estimate",), self._post_repository.estimate_count)
+            if estimate is not None and estimate >= settings.POST_COUNT_APPROXIMATE_MIN_ROWS:
+                return estimate, False
+
+        return await self._cached_count(("all",), self._post_repository.count_all), True
+
+    async def _import_chunk(self, author_id: int, chunk: List[Tuple[int, PostCreate]]) -> List[PostImportItemResult]:
+        """Проверить категории, санитизировать и вставить пачку постов (внутренняя бизнес-логика)"""
+        results = []
+        categories = {
+            category_id: await category_registry.get_by_id(self._db_session, category_id)
+            for category_id in {post_data.category_id for _, post_data in chunk}
+        }
+
+        pending = []
+        for index, post_data in chunk:
+            if categories[post_data.category_id] is None:
+                results.append(PostImportItemResult(index=index, slug=post_data.slug, error="Category not found"))
+            else:
+                pending.append((index, post_data))
+
+        contents = await content_sanitizer.sanitize_many([post_data.content for _, post_data in pending])
+        rows = [
+            {**post_data.model_dump(), "content": content, "author_id": author_id}
+            for (_, post_data), content in zip(pending, contents)
+        ]
+
+        try:
+            inserted = await self._post_repository.bulk_create(rows)
+            await self._db_session.commit()
+        except SQLAlchemyError as error:
+            await self._db_session.rollback()
+            logger.error(f"Database error during post import: {error}")
+            return results + [
+                PostImportItemResult(index=index, slug=post_data.slug, error="Database error")
+                for index, post_data in pending
+            ]
+
+        if inserted:
+            self._invalidate_caches(FEED_TAG, CATEGORY_FEEDS_TAG)
+
+        for index, post_data in pending:
+            post_id = inserted.get(post_data.slug)
+            results.append(PostImportItemResult(
+                index=index,
+                slug=post_data.slug,
+                id=post_id,
+                error=None if post_id else "Post with this slug already exists"
+            ))
+        return results
+
+    @staticmethod
+    def _parse_import_item(raw: Any) -> PostCreate:
+        """Разобрать элемент импорта (строка JSON или словарь; ошибка источника пробрасывается)"""
+        if isinstance(raw, ValueError):
+            raise raw
+        if isinstance(raw, (bytes, str)):
+            return PostCreate.model_validate_json(raw)
+        return PostCreate.model_validate(raw)
+
+    @staticmethod
+    def _format_validation_error(error: ValidationError) -> str:
+        """Краткое описание ошибок валидации элемента импорта"""
+        return "; ".join(
+            f"{'.'.join(map(str, item['loc']))}: {item['msg']}" if item['loc'] else item['msg']
+            for item in error.errors()
+        )
+
+    @staticmethod
+    def _invalidate_caches(*tags: str) -> None:
+        """Сбросить счетчики и закэшированные ответы после изменения постов (внутренняя бизнес-логика)"""
+        post_count_cache.clear()
+        response_cache.invalidate_tags(*tags)
+
+    @staticmethod
+    async def _cached_count(
+            key: Hashable,
+            load: Callable[[], Awaitable[Optional[int]]]
+    ) -> Optional[int]:
+        """Получить счетчик из кэша или подсчитать и закэшировать (внутренняя бизнес-логика)
+
+        None - подсчет не удался (не кэшируется).
+        """
+        total = post_count_cache.get(key)
+        if total is not None:
+            return total
+
+        total = await load()
+        if total is not None:
+            post_count_cache.set(key, total)
+        return total
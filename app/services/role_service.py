@@ -2,6 +2,7 @@ from typing import List, Tuple, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 import logging
+from app.core.security import invalidate_principal
 from app.repositories.base import UserRepositoryInterface, RoleRepositoryInterface
 from app.models.user import User
 from app.models.role import Role, user_role_association
@@ -46,6 +47,7 @@ class RoleService:
                 return False, "Failed to assign role"
 
             await self._db_session.commit()
+            invalidate_principal(user_id)
             return True, None
 
         except SQLAlchemyError as error:
@@ -77,6 +79,7 @@ class RoleService:
                 return False, "Failed to remove role"
 
             await self._db_session.commit()
+            invalidate_principal(user_id)
             return True, None
 
         except SQLAlchemyError as error:
@@ -0,0 +1,114 @@
+import asyncio
+import logging
+import time
+from typing import Callable, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.database import db_manager
+from app.repositories.refresh_token_repository import RefreshTokenRepository
+
+logger = logging.getLogger(__name__)
+
+
+class TokenSweeper:
+    """Фоновая очистка просроченных refresh токенов пачками
+
+    Каждая пачка удаляется отдельной короткой транзакцией. Пауза между пачками
+    пропорциональна времени удаления (доля занятости DUTY_CYCLE): чем медленнее
+    отвечает нагруженная БД, тем реже сборщик к ней обращается.
+    """
+
+    def __init__(
+            self,
+            session_factory: Callable[[], AsyncSession],
+            batch_size: int,
+            interval: float,
+            duty_cycle: float
+    ):
+        if not 0 < duty_cycle <= 1:
+            raise ValueError("duty_cycle must be in (0, 1]")
+        self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._interval = interval
+        self._duty_cycle = duty_cycle
+        self._task: Optional[asyncio.Task] = None
+        self.runs = 0
+        self.batches = 0
+        self.deleted = 0
+        self.errors = 0
+        self.last_run_deleted = 0
+        self.last_run_seconds = 0.0
+
+    async def sweep(self) -> int:
+        """Удалить все просроченные токены и вернуть число удаленных строк"""
+        started_at = time.perf_counter()
+        removed = 0
+        while True:
+            batch_started_at = time.perf_counter()
+            async with self._session_factory() as session:
+                deleted = await RefreshTokenRepository(session).delete_expired_tokens(self._batch_size)
+                await session.commit()
+
+            removed += deleted
+            self.batches += 1
+            self.deleted += deleted
+            if deleted < self._batch_size:
+                break
+
+            elapsed = time.perf_counter() - batch_started_at
+            await asyncio.sleep(elapsed * (1 - self._duty_cycle) / self._duty_cycle)
+
+        self.runs += 1
+        self.last_run_deleted = removed
+        self.last_run_seconds = round(time.perf_counter() - started_at, 3)
+        logger.info(f"Token sweeper removed {removed} expired refresh tokens in {self.last_run_seconds}s")
+        return removed
+
+    async def run(self) -> None:
+        """Запускать очистку каждые interval секунд до отмены"""
+        while True:
+            try:
+                await self.sweep()
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                self.errors += 1
+                logger.error(f"Token sweeper failed: {error}")
+            await asyncio.sleep(self._interval)
+
+    def start(self) -> None:
+        """Запустить фоновую задачу"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run(), name="token-sweeper")
+
+    async def stop(self) -> None:
+        """Остановить фоновую задачу"""
+        task, self._task = self._task, None
+        if task is None:
+            return
+
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def stats(self) -> dict:
+        """Счетчики очистки"""
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "runs": self.runs,
+            "batches": self.batches,
+            "deleted": self.deleted,
+            "errors": self.errors,
+            "last_run_deleted": self.last_run_deleted,
+            "last_run_seconds": self.last_run_seconds
+        }
+
+
+token_sweeper = TokenSweeper(
+    session_factory=db_manager.async_session,
+    batch_size=settings.TOKEN_SWEEPER_BATCH_SIZE,
+    interval=settings.TOKEN_SWEEPER_INTERVAL_SECONDS,
+    duty_cycle=settings.TOKEN_SWEEPER_DUTY_CYCLE
+)
@@ -2,6 +2,8 @@ from typing import List, Tuple, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 import logging
+from app.core.cache import response_cache, author_tag
+from app.core.security import invalidate_principal
 from app.repositories.base import UserRepositoryInterface, RoleRepositoryInterface
 from app.schemas.user import UserRoleUpdate
 from app.models.role import user_role_association, Role
@@ -57,6 +59,7 @@ class UserService:
                         return False, f"Failed to add role '{role_name}'"
 
             await self._db_session.commit()
+            invalidate_principal(user_id)
             return True, None
 
         except SQLAlchemyError as error:
@@ -65,17 +68,16 @@ class UserService:
             return False, "Database error"
 
     async def deactivate_user(self, user_id: int) -> Tuple[bool, Optional[str]]:
-        """Деактивировать пользователя (бизнес-логика)"""
+        """Деактивировать пользователя одним UPDATE ... RETURNING (бизнес-логика)"""
         try:
-            user = await self._user_repository.get_by_id(user_id)
-            if not user:
-                return False, "User not found"
-
             success = await self._user_repository.delete(user_id)
             if not success:
-                return False, "Failed to deactivate user"
+                return False, "User not found"
 
             await self._db_session.commit()
+            invalidate_principal(user_id)
+            # Посты со встроенным автором в кэше ответов
+            response_cache.invalidate_tags(author_tag(user_id))
             return True, None
 
         except SQLAlchemyError as error:
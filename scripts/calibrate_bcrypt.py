@@ -0,0 +1,49 @@
+import argparse
+import statistics
+import sys
+import time
+from typing import Optional
+import bcrypt
+
+
+def measure(rounds: int, samples: int) -> float:
+    """Медианное время хеширования (мс) для заданной стоимости"""
+    timings = []
+    for _ in range(samples):
+        salt = bcrypt.gensalt(rounds=rounds)
+        started = time.perf_counter()
+        bcrypt.hashpw(b"calibration-password", salt)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate(target_ms: float, min_rounds: int, max_rounds: int, samples: int) -> Optional[int]:
+    """Наибольшая стоимость, укладывающаяся в целевое время хеширования (None, если не подходит ни одна)"""
+    recommended = None
+    for rounds in range(min_rounds, max_rounds + 1):
+        elapsed = measure(rounds, samples)
+        fits = elapsed <= target_ms
+        print(f"rounds={rounds:2d}  {elapsed:9.1f} ms  {'✅' if fits else '❌'}")
+        if not fits:
+            break
+        recommended = rounds
+    return recommended
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Подбор BCRYPT_ROUNDS под целевое время хеширования на этом хосте")
+    parser.add_argument("--target-ms", type=float, default=250.0, help="целевое время одного хеширования, мс")
+    parser.add_argument("--min-rounds", type=int, default=10)
+    parser.add_argument("--max-rounds", type=int, default=16)
+    parser.add_argument("--samples", type=int, default=3, help="замеров на каждую стоимость")
+    args = parser.parse_args()
+
+    rounds = calibrate(args.target_ms, args.min_rounds, args.max_rounds, args.samples)
+    if rounds is None:
+        print(
+            f"\n⚠️  Даже rounds={args.min_rounds} не укладывается в {args.target_ms} ms: "
+            f"увеличьте --target-ms или уменьшите --min-rounds",
+            file=sys.stderr
+        )
+        sys.exit(1)
+    print(f"\nРекомендуемое значение: BCRYPT_ROUNDS={rounds}")
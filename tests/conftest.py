@@ -1,16 +1,50 @@
 import asyncio
+import os
 import pytest
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
 
-from app.core.database import db_manager, get_db
+# The sweeper would poll the real database from every TestClient lifespan
+os.environ.setdefault("TOKEN_SWEEPER_ENABLED", "false")
+
+from app.core.database import db_manager, get_db, get_session_factory
 from app.main import app
 from app.models.base import Base
 from app.core.security import SecurityService
 
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
+# FTS5 stand-in for the Postgres search_vector column and its GIN index
+POSTS_FTS_DDL = (
+    """
+    CREATE VIRTUAL TABLE posts_fts USING fts5(
+        title, excerpt, content, content='posts', content_rowid='id'
+    )
+    """,
+    """
+    CREATE TRIGGER posts_fts_insert AFTER INSERT ON posts BEGIN
+        INSERT INTO posts_fts(rowid, title, excerpt, content)
+        VALUES (new.id, new.title, coalesce(new.excerpt, ''), new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER posts_fts_delete AFTER DELETE ON posts BEGIN
+        INSERT INTO posts_fts(posts_fts, rowid, title, excerpt, content)
+        VALUES ('delete', old.id, old.title, coalesce(old.excerpt, ''), old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER posts_fts_update AFTER UPDATE ON posts BEGIN
+        INSERT INTO posts_fts(posts_fts, rowid, title, excerpt, content)
+        VALUES ('delete', old.id, old.title, coalesce(old.excerpt, ''), old.content);
+        INSERT INTO posts_fts(rowid, title, excerpt, content)
+        VALUES (new.id, new.title, coalesce(new.excerpt, ''), new.content);
+    END
+    """,
+)
+
 
 @pytest.fixture(scope="session")
 def event_loop():
@@ -33,6 +67,9 @@ async def engine():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(text("DROP TABLE IF EXISTS posts_fts"))
+        for statement in POSTS_FTS_DDL:
+            await conn.execute(text(statement))
 
     yield engine
     await engine.dispose()
@@ -54,6 +91,34 @@ async def session(engine):
         await connection.rollback()
 
 
+@pytest.fixture
+def query_counter(engine):
+    """Collect SQL statements executed through the test engine."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture(autouse=True)
+def reset_caches():
+    """Reset process-wide caches so tests don't see each other's data."""
+    from app.core.cache import post_count_cache, response_cache, principal_cache
+    from app.core.category_registry import category_registry
+    from app.core.security import token_revocations, token_cache
+
+    post_count_cache.clear()
+    response_cache.clear()
+    principal_cache.clear()
+    token_revocations.clear()
+    token_cache.clear()
+    category_registry.invalidate()
+
+
 @pytest.fixture
 def client(session):
     """Create test client with overridden database dependency."""
@@ -61,7 +126,12 @@ def client(session):
     async def override_get_db():
         yield session
 
+    # Streaming exports open their own sessions; bind them to the test transaction
+    async def override_get_session_factory():
+        return async_sessionmaker(session.bind, expire_on_commit=False, class_=AsyncSession)
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = override_get_session_factory
 
     with TestClient(app) as client:
         yield client
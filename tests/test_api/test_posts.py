@@ -154,4 +154,351 @@ class TestPostsAPI:
         assert response.status_code == 204
 
         response = client.get("/api/v1/posts/post-to-delete")
-        assert response.status_code == 404
\ No newline at end of file
+        assert response.status_code == 404
+
+    def test_get_posts_cursor_pagination(self, client, test_category, test_user, session):
+        """Test following next_cursor through the public feed."""
+        from app.repositories.post_repository import PostRepository
+        from datetime import datetime
+        import asyncio
+
+        async def create_test_posts():
+            post_repo = PostRepository(session)
+            for day in (1, 2, 3):
+                await post_repo.create(
+                    title=f"Feed Post {day}",
+                    slug=f"feed-post-{day}",
+                    content="Feed content",
+                    category_id=test_category.id,
+                    author_id=test_user.id,
+                    is_published=True,
+                    created_at=datetime(2025, 1, day)
+                )
+            await session.commit()
+
+        asyncio.run(create_test_posts())
+
+        response = client.get("/api/v1/posts/", params={"limit": 2})
+        assert response.status_code == 200
+        data = response.json()
+        assert [post["slug"] for post in data["posts"]] == ["feed-post-3", "feed-post-2"]
+        assert data["total"] == 3
+        assert data["total_is_exact"] is True
+        assert "content" not in data["posts"][0]
+        assert data["has_more"] is True
+        assert data["next_cursor"]
+
+        response = client.get("/api/v1/posts/", params={"limit": 2, "cursor": data["next_cursor"]})
+        assert response.status_code == 200
+        data = response.json()
+        assert [post["slug"] for post in data["posts"]] == ["feed-post-1"]
+        assert data["has_more"] is False
+        assert data["next_cursor"] is None
+
+    def test_get_posts_invalid_cursor(self, client):
+        """Test that a malformed cursor is rejected."""
+        response = client.get("/api/v1/posts/", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400
+
+    def test_public_post_cache_invalidated_on_update(self, client, admin_headers, test_category):
+        """Test that cached public responses are served and dropped after an admin write."""
+        from app.core.cache import response_cache
+
+        post_data = {
+            "title": "Cached Post",
+            "slug": "cached-post",
+            "content": "Cached content",
+            "category_id": test_category.id,
+            "is_published": True
+        }
+        response = client.post("/api/v1/admin/posts/", json=post_data, headers=admin_headers)
+        post_id = response.json()["id"]
+
+        assert client.get("/api/v1/posts/cached-post").json()["title"] == "Cached Post"
+        hits = response_cache.stats()["hits"]
+        assert client.get("/api/v1/posts/cached-post").json()["title"] == "Cached Post"
+        assert response_cache.stats()["hits"] == hits + 1
+
+        client.put(f"/api/v1/admin/posts/{post_id}", json={"title": "Renamed Post"}, headers=admin_headers)
+
+        assert client.get("/api/v1/posts/cached-post").json()["title"] == "Renamed Post"
+        assert client.get("/api/v1/posts/").json()["posts"][0]["title"] == "Renamed Post"
+
+    def test_get_post_if_none_match(self, client, admin_headers, test_category):
+        """Test ETag revalidation of a public post."""
+        post_data = {
+            "title": "Tagged Post",
+            "slug": "tagged-post",
+            "content": "Tagged content",
+            "category_id": test_category.id,
+            "is_published": True
+        }
+        response = client.post("/api/v1/admin/posts/", json=post_data, headers=admin_headers)
+        post_id = response.json()["id"]
+
+        response = client.get("/api/v1/posts/tagged-post")
+        etag = response.headers["etag"]
+
+        response = client.get("/api/v1/posts/tagged-post", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+        client.put(f"/api/v1/admin/posts/{post_id}", json={"excerpt": "New excerpt"}, headers=admin_headers)
+
+        response = client.get("/api/v1/posts/tagged-post", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_get_posts_if_none_match(self, client):
+        """Test ETag revalidation of the public feed."""
+        response = client.get("/api/v1/posts/")
+        etag = response.headers["etag"]
+
+        response = client.get("/api/v1/posts/", headers={"If-None-Match": f"W/{etag}"})
+        assert response.status_code == 304
+
+    def test_search_posts(self, client, admin_headers, test_category):
+        """Test full-text search with cursor pagination."""
+        for slug, title, content in (
+            ("fts-title", "Postgres indexing", "Notes"),
+            ("fts-content", "Weekly notes", "Postgres tuning tips"),
+            ("fts-other", "Gardening", "Tomatoes"),
+        ):
+            post_data = {
+                "title": title,
+                "slug": slug,
+                "content": content,
+                "category_id": test_category.id,
+                "is_published": True
+            }
+            client.post("/api/v1/admin/posts/", json=post_data, headers=admin_headers)
+
+        response = client.get("/api/v1/posts/search", params={"q": "postgres", "limit": 1})
+        assert response.status_code == 200
+        data = response.json()
+        assert [post["slug"] for post in data["posts"]] == ["fts-title"]
+        assert data["has_more"] is True
+
+        response = client.get("/api/v1/posts/search", params={"q": "postgres", "limit": 1, "cursor": data["next_cursor"]})
+        data = response.json()
+        assert [post["slug"] for post in data["posts"]] == ["fts-content"]
+        assert data["has_more"] is False
+        assert data["next_cursor"] is None
+
+    def test_search_posts_validation(self, client):
+        """Test that empty queries and malformed cursors are rejected."""
+        assert client.get("/api/v1/posts/search", params={"q": ""}).status_code == 422
+        response = client.get("/api/v1/posts/search", params={"q": "postgres", "cursor": "bad"})
+        assert response.status_code == 400
+
+    def test_search_cursor_is_bound_to_query(self, client, admin_headers, test_category):
+        """Test that a search cursor is rejected when replayed with a different query."""
+        for slug in ("fts-bound-1", "fts-bound-2"):
+            post_data = {
+                "title": "Postgres replicas",
+                "slug": slug,
+                "content": "Notes",
+                "category_id": test_category.id,
+                "is_published": True
+            }
+            client.post("/api/v1/admin/posts/", json=post_data, headers=admin_headers)
+
+        response = client.get("/api/v1/posts/search", params={"q": "postgres", "limit": 1})
+        cursor = response.json()["next_cursor"]
+        assert cursor is not None
+
+        response = client.get("/api/v1/posts/search", params={"q": "replicas", "limit": 1, "cursor": cursor})
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
+
+    def test_get_category_posts(self, client, admin_headers, test_category):
+        """Test the public category feed and its 404 for unknown slugs."""
+        post_data = {
+            "title": "Category Post",
+            "slug": "category-post",
+            "content": "Category content",
+            "category_id": test_category.id,
+            "is_published": True
+        }
+        client.post("/api/v1/admin/posts/", json=post_data, headers=admin_headers)
+
+        response = client.get(f"/api/v1/categories/{test_category.slug}/posts")
+        assert response.status_code == 200
+        data = response.json()
+        assert [post["slug"] for post in data["posts"]] == ["category-post"]
+        assert data["total"] == 1
+
+        assert client.get("/api/v1/categories/missing-category/posts").status_code == 404
+
+        categories = client.get("/api/v1/categories/").json()
+        assert [category["slug"] for category in categories] == [test_category.slug]
+
+    def test_bulk_import_posts(self, client, admin_headers, test_category):
+        """Test bulk import with a per-item report."""
+        client.post("/api/v1/admin/posts/", json={
+            "title": "Existing Post",
+            "slug": "existing-post",
+            "content": "Existing content",
+            "category_id": test_category.id
+        }, headers=admin_headers)
+
+        items = [
+            {"title": "Bulk One", "slug": "bulk-one", "content": "<p>One</p><script>x</script>",
+             "category_id": test_category.id, "is_published": True},
+            {"title": "Bulk Two", "slug": "existing-post", "content": "Taken slug", "category_id": test_category.id},
+            {"title": "Bulk Three", "slug": "bulk-three", "content": "No category", "category_id": 999},
+            {"title": "Bulk Four", "slug": "bulk-one", "content": "Repeated slug", "category_id": test_category.id},
+            {"title": "x", "slug": "bulk-five", "content": "Too short title", "category_id": test_category.id}
+        ]
+        response = client.post("/api/v1/admin/posts/bulk", json=items, headers=admin_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["created"], data["failed"]) == (1, 4)
+        errors = [result["error"] for result in data["results"]]
+        assert errors[0] is None
+        assert errors[1] == "Post with this slug already exists"
+        assert errors[2] == "Category not found"
+        assert errors[3] == "Duplicate slug in import"
+        assert "title" in errors[4]
+
+        post = client.get("/api/v1/posts/bulk-one").json()
+        assert post["content"] == "<p>One</p>x"
+        assert post["is_active"] is True
+
+    def test_bulk_import_posts_ndjson(self, client, admin_headers, test_category):
+        """Test bulk import from an NDJSON stream."""
+        import json
+
+        lines = [
+            json.dumps({"title": f"Stream {i}", "slug": f"stream-{i}", "content": "Streamed content",
+                        "category_id": test_category.id})
+            for i in range(3)
+        ]
+        body = "\n".join(lines[:2] + ["{not json"] + lines[2:]) + "\n"
+        response = client.post(
+            "/api/v1/admin/posts/bulk",
+            content=body,
+            headers={**admin_headers, "Content-Type": "application/x-ndjson"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["created"], data["failed"]) == (3, 1)
+        assert [result["index"] for result in data["results"]] == [0, 1, 2, 3]
+        assert data["results"][2]["id"] is None
+
+    def test_bulk_import_ndjson_rejects_long_lines(self, client, admin_headers, test_category, monkeypatch):
+        """Test that an oversized NDJSON line fails alone and the stream keeps going."""
+        import json
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "BULK_IMPORT_MAX_LINE_BYTES", 200)
+        short = {"title": "Short", "slug": "short-line", "content": "Short content", "category_id": test_category.id}
+        long = {**short, "slug": "long-line", "content": "x" * 500}
+        body = "\n".join([json.dumps(long), json.dumps(short)]) + "\n"
+        response = client.post(
+            "/api/v1/admin/posts/bulk",
+            content=body,
+            headers={**admin_headers, "Content-Type": "application/x-ndjson"}
+        )
+
+        data = response.json()
+        assert (data["created"], data["failed"]) == (1, 1)
+        assert data["results"][0]["error"] == "Line exceeds 200 bytes"
+        assert data["results"][1]["slug"] == "short-line"
+
+    def test_bulk_import_rejects_large_body(self, client, admin_headers, monkeypatch):
+        """Test that a JSON array body over the size limit is refused."""
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "BULK_IMPORT_MAX_BODY_BYTES", 100)
+        items = [{"title": "Big", "slug": "big", "content": "x" * 200, "category_id": 1}]
+        response = client.post("/api/v1/admin/posts/bulk", json=items, headers=admin_headers)
+        assert response.status_code == 413
+
+    def test_bulk_import_requires_array(self, client, admin_headers):
+        """Test that a JSON body must be an array."""
+        response = client.post("/api/v1/admin/posts/bulk", json={"title": "Single"}, headers=admin_headers)
+        assert response.status_code == 400
+
+    def test_export_posts(self, client, admin_headers, test_category):
+        """Test streaming export in NDJSON and CSV."""
+        import csv
+        import json
+
+        for i in range(3):
+            client.post("/api/v1/admin/posts/", json={
+                "title": f"Export {i}",
+                "slug": f"export-{i}",
+                "content": f"Export content, line {i}",
+                "category_id": test_category.id
+            }, headers=admin_headers)
+
+        response = client.get("/api/v1/admin/posts/export", headers=admin_headers)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["slug"] for row in rows] == ["export-0", "export-1", "export-2"]
+        assert rows[0]["content"] == "Export content, line 0"
+
+        response = client.get("/api/v1/admin/posts/export?format=csv", headers=admin_headers)
+        assert response.status_code == 200
+        assert 'filename="posts.csv"' in response.headers["content-disposition"]
+        records = list(csv.DictReader(response.text.splitlines()))
+        assert [record["slug"] for record in records] == ["export-0", "export-1", "export-2"]
+        assert records[1]["excerpt"] == ""
+
+    def test_export_csv_escapes_formulas(self, client, admin_headers, test_category):
+        """Test that CSV cells that spreadsheets would evaluate are prefixed with a quote."""
+        import csv
+
+        client.post("/api/v1/admin/posts/", json={
+            "title": "=HYPERLINK(\"http://example.com\")",
+            "slug": "formula-post",
+            "content": "-2+3 is one",
+            "category_id": test_category.id
+        }, headers=admin_headers)
+
+        response = client.get("/api/v1/admin/posts/export?format=csv", headers=admin_headers)
+        record = next(csv.DictReader(response.text.splitlines()))
+        assert record["title"] == "'=HYPERLINK(\"http://example.com\")"
+        assert record["content"] == "'-2+3 is one"
+        assert record["slug"] == "formula-post"
+
+    def test_export_posts_requires_admin(self, client):
+        """Test that export is admin-only."""
+        response = client.get("/api/v1/admin/posts/export")
+        assert response.status_code in (401, 403)
+
+    def test_cached_post_drops_deactivated_author(self, client, admin_headers, test_category, test_user, session):
+        """Test that deactivating an author invalidates cached posts embedding them."""
+        from app.repositories.post_repository import PostRepository
+        import asyncio
+
+        async def create_test_post():
+            await PostRepository(session).create(
+                title="Authored Post",
+                slug="authored-post",
+                content="Authored content",
+                category_id=test_category.id,
+                author_id=test_user.id,
+                is_published=True
+            )
+            await session.commit()
+
+        asyncio.run(create_test_post())
+
+        assert client.get("/api/v1/posts/authored-post").json()["author"]["is_active"] is True
+
+        client.delete(f"/api/v1/admin/users/{test_user.id}", headers=admin_headers)
+
+        assert client.get("/api/v1/posts/authored-post").json()["author"]["is_active"] is False
+
+    def test_metrics_requires_admin(self, client, admin_headers):
+        """Test that cache and worker metrics are admin-only."""
+        assert client.get("/metrics").status_code in (401, 403)
+
+        response = client.get("/metrics", headers=admin_headers)
+        assert response.status_code == 200
+        assert "response_cache" in response.json()
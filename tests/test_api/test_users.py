@@ -0,0 +1,89 @@
+class TestUsersAPI:
+    def test_principal_is_cached(self, client, auth_headers, query_counter):
+        """Test that repeated authenticated calls reuse the cached principal."""
+        assert client.get("/api/v1/users/me", headers=auth_headers).status_code == 200
+
+        query_counter.clear()
+        response = client.get("/api/v1/users/me", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.json()["email"] == "test@example.com"
+        assert query_counter == []
+
+    def test_deactivation_revokes_cached_principal(self, client, auth_headers, admin_headers, test_user):
+        """Test that deactivating a user drops its cached principal."""
+        assert client.get("/api/v1/users/me", headers=auth_headers).status_code == 200
+
+        response = client.delete(f"/api/v1/admin/users/{test_user.id}", headers=admin_headers)
+        assert response.status_code == 204
+
+        assert client.get("/api/v1/users/me", headers=auth_headers).status_code == 401
+
+    def test_deactivate_missing_user(self, client, admin_headers, query_counter):
+        """Test that deactivation is a single UPDATE and reports a missing user."""
+        assert client.get("/api/v1/users/me", headers=admin_headers).status_code == 200
+
+        query_counter.clear()
+        response = client.delete("/api/v1/admin/users/999999", headers=admin_headers)
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "User not found"
+        assert [statement.split()[0] for statement in query_counter] == ["UPDATE"]
+
+    def test_role_update_refreshes_cached_principal(self, client, auth_headers, admin_headers, test_user):
+        """Test that role changes are visible on the next request."""
+        assert client.get("/api/v1/users/me", headers=auth_headers).json()["roles"] == []
+
+        response = client.put(
+            f"/api/v1/admin/users/{test_user.id}/roles",
+            json={"roles": ["admin"]},
+            headers=admin_headers
+        )
+        assert response.status_code == 200
+
+        assert client.get("/api/v1/users/me", headers=auth_headers).json()["roles"] == ["admin"]
+
+    def test_stateless_authorization(self, client, admin_headers, test_user, session, query_counter, monkeypatch):
+        """Test that stateless mode authorizes from claims and honours revocation."""
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "AUTH_STATELESS", True)
+        client.put(f"/api/v1/admin/users/{test_user.id}/roles", json={"roles": ["admin"]}, headers=admin_headers)
+
+        login_data = {"email": "test@example.com", "password": "testpassword123"}
+        token = client.post("/api/v1/auth/login", json=login_data).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        query_counter.clear()
+        response = client.delete("/api/v1/admin/posts/999999", headers=headers)
+        assert response.status_code == 400
+        assert not any("user_roles" in statement for statement in query_counter)
+
+        client.put(f"/api/v1/admin/users/{test_user.id}/roles", json={"roles": []}, headers=admin_headers)
+        response = client.delete("/api/v1/admin/posts/999999", headers=headers)
+        assert response.status_code == 401
+
+        # the test client shares one session, so drop the user's stale roles collection
+        session.expire_all()
+        token = client.post("/api/v1/auth/login", json=login_data).json()["access_token"]
+        response = client.delete("/api/v1/admin/posts/999999", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 403
+
+    def test_refresh_token_is_not_an_access_token(self, client, test_user):
+        """Test that refresh tokens are rejected as bearer credentials."""
+        login_data = {"email": "test@example.com", "password": "testpassword123"}
+        refresh_token = client.post("/api/v1/auth/login", json=login_data).json()["refresh_token"]
+
+        response = client.get("/api/v1/users/me", headers={"Authorization": f"Bearer {refresh_token}"})
+        assert response.status_code == 401
+
+    def test_export_users(self, client, admin_headers, test_user):
+        """Test streaming user export without password hashes."""
+        import json
+
+        response = client.get("/api/v1/admin/users/export", headers=admin_headers)
+
+        assert response.status_code == 200
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert test_user.email in [row["email"] for row in rows]
+        assert all("password_hash" not in row for row in rows)
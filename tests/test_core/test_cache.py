@@ -0,0 +1,48 @@
+from app.core.cache import TTLCache
+
+
+class TestTTLCache:
+    def test_get_and_set(self):
+        """Test basic cache hit and miss accounting."""
+        cache = TTLCache(maxsize=10, ttl=60)
+
+        assert cache.get("missing") is None
+        cache.set("key", b"value")
+        assert cache.get("key") == b"value"
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_expired_entry_is_skipped(self):
+        """Test that expired entries are dropped on access."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("key", "value", ttl=0)
+
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["evictions"] == 1
+
+    def test_invalidate_tags(self):
+        """Test tag-based invalidation removes only tagged entries."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("feed", 1, tags=["feed"])
+        cache.set("post", 2, tags=["post:1", "category:1"])
+        cache.set("other", 3, tags=["category:2"])
+
+        cache.invalidate_tags("category:1")
+
+        assert cache.get("post") is None
+        assert cache.get("feed") == 1
+        assert cache.get("other") == 3
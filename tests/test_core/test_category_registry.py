@@ -0,0 +1,40 @@
+import pytest
+from app.core.category_registry import CategoryRegistry
+from app.repositories.category_repository import CategoryRepository
+
+
+class TestCategoryRegistry:
+    async def test_lookups_are_served_from_snapshot(self, session, test_category, query_counter):
+        """Test that loaded categories are looked up without SQL."""
+        registry = CategoryRegistry(ttl=60, miss_refresh_interval=60)
+        await registry.refresh(session)
+        query_counter.clear()
+
+        assert (await registry.get_by_id(session, test_category.id)).slug == test_category.slug
+        assert (await registry.get_by_slug(session, test_category.slug)).id == test_category.id
+        assert query_counter == []
+
+    async def test_snapshot_is_immutable(self, session, test_category):
+        """Test that snapshot entries and indexes cannot be modified."""
+        from dataclasses import FrozenInstanceError
+
+        registry = CategoryRegistry(ttl=60, miss_refresh_interval=60)
+        snapshot = await registry.snapshot(session)
+
+        with pytest.raises(TypeError):
+            snapshot.by_slug["other"] = snapshot.by_id[test_category.id]
+        with pytest.raises(FrozenInstanceError):
+            snapshot.by_id[test_category.id].name = "Changed"
+
+    async def test_miss_refresh(self, session, test_category):
+        """Test that a miss reloads the snapshot once the refresh interval allows it."""
+        registry = CategoryRegistry(ttl=60, miss_refresh_interval=60)
+        await registry.refresh(session)
+
+        await CategoryRepository(session).create(name="Late", slug="late-category")
+        await session.commit()
+
+        assert await registry.get_by_slug(session, "late-category") is None
+
+        registry._miss_refresh_interval = 0
+        assert (await registry.get_by_slug(session, "late-category")).name == "Late"
@@ -0,0 +1,20 @@
+from app.core.sanitizer import ContentSanitizer
+from app.models.post import Post
+
+
+class TestContentSanitizer:
+    async def test_sanitize_many_in_process_pool(self):
+        """Test that pooled sanitization matches Post.sanitize_html and keeps order."""
+        sanitizer = ContentSanitizer(max_workers=2, min_parallel_items=2)
+        contents = [f"<p>{i}</p><script>alert({i})</script>" for i in range(5)]
+        try:
+            assert await sanitizer.sanitize_many(contents) == [Post.sanitize_html(content) for content in contents]
+        finally:
+            sanitizer.shutdown()
+
+    async def test_small_batch_runs_inline(self):
+        """Test that batches below the threshold do not start the pool."""
+        sanitizer = ContentSanitizer(max_workers=2, min_parallel_items=10)
+
+        assert await sanitizer.sanitize_many(["<b>bold</b>"]) == ["bold"]
+        assert sanitizer._executor is None
@@ -0,0 +1,74 @@
+from datetime import timedelta
+from app.core.security import SecurityService, token_cache
+
+
+class TestTokenVerificationCache:
+    def test_repeated_verification_hits_cache(self):
+        """Test that a verified token is served from the cache."""
+        token = SecurityService.create_access_token({"sub": "1", "roles": ["admin"]})
+
+        first = SecurityService.verify_token(token)
+        hits = token_cache.stats()["hits"]
+        second = SecurityService.verify_token(token)
+
+        assert first == second
+        assert first["roles"] == ["admin"]
+        assert token_cache.stats()["hits"] == hits + 1
+
+    def test_cached_payload_is_not_shared(self):
+        """Test that callers cannot mutate the cached payload."""
+        token = SecurityService.create_access_token({"sub": "1"})
+
+        SecurityService.verify_token(token)["sub"] = "2"
+
+        assert SecurityService.verify_token(token)["sub"] == "1"
+
+    def test_invalid_tokens_are_not_cached(self):
+        """Test that tampered and expired tokens are rejected and not stored."""
+        token = SecurityService.create_access_token({"sub": "1"})
+        expired = SecurityService.create_access_token({"sub": "1"}, expires_delta=timedelta(seconds=-1))
+
+        assert SecurityService.verify_token(token[:-2] + "xx") is None
+        assert SecurityService.verify_token(expired) is None
+        assert len(token_cache) == 0
+
+    def test_cache_is_keyed_by_digest(self):
+        """Test that raw tokens are not kept as cache keys."""
+        token = SecurityService.create_access_token({"sub": "1"})
+        SecurityService.verify_token(token)
+
+        assert token_cache.get(SecurityService.token_digest(token)) is not None
+        assert token_cache.get(token) is None
+
+
+class TestPasswordHasher:
+    async def test_async_hash_and_verify(self):
+        """Test hashing and verification on the password hasher pool."""
+        from app.core.security import password_hasher
+
+        completed = password_hasher.stats()["completed"]
+        password_hash = await SecurityService.hash_password_async("secret-password")
+
+        assert await SecurityService.verify_password_async("secret-password", password_hash) is True
+        assert await SecurityService.verify_password_async("wrong-password", password_hash) is False
+        assert password_hasher.stats()["completed"] == completed + 3
+
+    async def test_event_loop_stays_responsive(self):
+        """Test that other coroutines run while a hash is computed."""
+        import asyncio
+
+        ticks = 0
+        done = False
+
+        async def ticker():
+            nonlocal ticks
+            while not done:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        task = asyncio.create_task(ticker())
+        await SecurityService.hash_password_async("secret-password")
+        done = True
+        await task
+
+        assert ticks > 1
@@ -1,6 +1,7 @@
 import pytest
 import pytest_asyncio
 from app.repositories.post_repository import PostRepository
+from app.repositories.loaders import LoadProfile
 
 
 class TestPostRepository:
@@ -57,8 +58,144 @@ class TestPostRepository:
         assert len(posts) > 0
         assert posts[0].is_published is True
 
-    async def test_get_posts_by_category(self, post_repo, test_post_data, test_category):
-        """Test getting posts by category."""
-        posts = await post_repo.get_posts_by_category(test_category.slug)
-        assert len(posts) > 0
-        assert posts[0].category_id == test_category.id
\ No newline at end of file
+    async def test_get_published_posts_with_cursor(self, post_repo, session, test_user, test_category):
+        """Test keyset pagination of published posts."""
+        from datetime import datetime
+
+        for day in (1, 2, 3):
+            await post_repo.create(
+                title=f"Cursor Post {day}",
+                slug=f"cursor-post-{day}",
+                content="Cursor content",
+                category_id=test_category.id,
+                author_id=test_user.id,
+                is_published=True,
+                created_at=datetime(2025, 1, day)
+            )
+        await session.commit()
+
+        first_page = await post_repo.get_published_posts(limit=2)
+        assert [post.slug for post in first_page] == ["cursor-post-3", "cursor-post-2"]
+
+        last = first_page[-1]
+        second_page = await post_repo.get_published_posts(limit=2, cursor=(last.created_at, last.id))
+        assert [post.slug for post in second_page] == ["cursor-post-1"]
+
+    async def test_get_published_posts_summary(self, post_repo, session, test_user, test_category):
+        """Test that summary mode does not load content or relationships."""
+        from sqlalchemy import inspect
+
+        await post_repo.create(
+            title="Summary Post",
+            slug="summary-post",
+            content="Long content",
+            category_id=test_category.id,
+            author_id=test_user.id,
+            is_published=True
+        )
+        await session.commit()
+        session.expunge_all()
+
+        posts = await post_repo.get_published_posts(profile=LoadProfile.SUMMARY)
+        unloaded = inspect(posts[0]).unloaded
+        assert {"content", "author", "category"} <= unloaded
+        assert posts[0].title == "Summary Post"
+
+    async def test_search_published_posts(self, post_repo, session, test_user, test_category):
+        """Test full-text search ranking and cursor pagination."""
+        for slug, title, content, is_published in (
+            ("search-title", "Asyncio deep dive", "Event loops", True),
+            ("search-content", "Python notes", "A few words about asyncio", True),
+            ("search-draft", "Asyncio draft", "Unpublished asyncio", False),
+            ("search-other", "Gardening", "Tomatoes", True),
+        ):
+            await post_repo.create(
+                title=title,
+                slug=slug,
+                content=content,
+                category_id=test_category.id,
+                author_id=test_user.id,
+                is_published=is_published
+            )
+        await session.commit()
+
+        results = await post_repo.search_published_posts("asyncio", limit=1)
+        assert [post.slug for post, _ in results] == ["search-title"]
+
+        post, rank = results[0]
+        next_page = await post_repo.search_published_posts("asyncio", limit=1, cursor=(rank, post.id))
+        assert [post.slug for post, _ in next_page] == ["search-content"]
+
+        assert await post_repo.search_published_posts('"') == []
+
+    async def test_get_published_posts_by_category_id(self, post_repo, test_post_data, test_category):
+        """Test filtering the published feed by category id."""
+        posts = await post_repo.get_published_posts(category_id=test_category.id)
+        assert [post.slug for post in posts] == [test_post_data.slug]
+
+        assert await post_repo.get_published_posts(category_id=test_category.id + 1) == []
+
+    @pytest.mark.parametrize("profile, expected_statements", [
+        (LoadProfile.EXISTENCE, 1),
+        (LoadProfile.SUMMARY, 1),
+        (LoadProfile.DETAIL, 1),
+        (LoadProfile.LIST, 3),
+    ])
+    async def test_load_profile_statement_count(
+            self, post_repo, session, test_post_data, query_counter, profile, expected_statements
+    ):
+        """Test the number of statements each load profile issues."""
+        session.expunge_all()
+        query_counter.clear()
+
+        posts = await post_repo.get_published_posts(profile=profile)
+
+        assert len(posts) == 1
+        assert len(query_counter) == expected_statements
+
+    async def test_existence_profile_skips_relationships(self, post_repo, session, test_post_data):
+        """Test that the existence profile leaves relationships unloaded."""
+        from sqlalchemy.exc import InvalidRequestError
+
+        session.expunge_all()
+        post = await post_repo.get_by_slug(test_post_data.slug, profile=LoadProfile.EXISTENCE)
+
+        assert post.id == test_post_data.id
+        with pytest.raises(InvalidRequestError):
+            post.author
+
+    async def test_update_and_delete_single_statement(self, post_repo, session, test_post_data, query_counter):
+        """Test that update and soft delete each issue one UPDATE ... RETURNING."""
+        session.expunge_all()
+        query_counter.clear()
+
+        post = await post_repo.update(test_post_data.id, title="Renamed")
+        assert post.title == "Renamed"
+        assert post.updated_at is not None
+        assert await post_repo.delete(test_post_data.id) is True
+        assert await post_repo.delete(999) is False
+
+        assert [statement.split()[0] for statement in query_counter] == ["UPDATE", "UPDATE", "UPDATE"]
+        assert all("RETURNING" in statement for statement in query_counter)
+
+    async def test_update_rejects_unknown_fields(self, post_repo, test_post_data):
+        """Test that unknown fields fail fast instead of being dropped."""
+        with pytest.raises(ValueError, match="titel"):
+            await post_repo.update(test_post_data.id, titel="Typo")
+
+    async def test_stream_all_in_batches(self, post_repo, session, test_user, test_category):
+        """Test that streaming yields posts in id order, one partition per batch."""
+        for i in range(3):
+            await post_repo.create(
+                title=f"Streamed {i}",
+                slug=f"streamed-{i}",
+                content="Content",
+                category_id=test_category.id,
+                author_id=test_user.id
+            )
+        await session.commit()
+
+        batches = [batch async for batch in post_repo.stream_all(batch_size=2)]
+
+        assert [len(batch) for batch in batches] == [2, 1]
+        assert [post.slug for batch in batches for post in batch] == ["streamed-0", "streamed-1", "streamed-2"]
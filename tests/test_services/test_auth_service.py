@@ -77,4 +77,151 @@ class TestAuthService:
         tokens = await auth_service.create_tokens(user_data)
         assert tokens is not None
         assert "access_token" in tokens
-        assert "refresh_token" in tokens
\ No newline at end of file
+        assert "refresh_token" in tokens
+
+    async def test_login_rehashes_password_with_configured_rounds(self, auth_service, session, test_user):
+        """Test that a hash with a different cost is upgraded on login."""
+        from passlib.context import CryptContext
+        from app.core.config import settings
+
+        weak_context = CryptContext(schemes=["bcrypt"], bcrypt__default_rounds=4)
+        test_user.password_hash = weak_context.hash("testpassword123")
+        await session.commit()
+
+        login_data = LoginRequest(email="test@example.com", password="testpassword123")
+        user_data, error = await auth_service.authenticate_user(login_data)
+        assert error is None
+        assert await auth_service.create_tokens(user_data) is not None
+
+        await session.refresh(test_user)
+        assert test_user.password_hash.startswith(f"$2b${settings.BCRYPT_ROUNDS:02d}$")
+
+    async def test_login_statement_count(self, auth_service, session, test_user, query_counter):
+        """Test that login issues one read, the token cap delete and one insert."""
+        session.expunge_all()
+        query_counter.clear()
+
+        login_data = LoginRequest(email="test@example.com", password="testpassword123")
+        user_data, error = await auth_service.authenticate_user(login_data)
+        tokens = await auth_service.create_tokens(user_data)
+
+        assert error is None
+        assert tokens is not None
+        verbs = [statement.split(None, 1)[0].upper() for statement in query_counter]
+        assert verbs == ["SELECT", "DELETE", "INSERT"]
+
+    async def test_refresh_rotation(self, auth_service, session, test_user, query_counter):
+        """Test that rotation marks the old token consumed in one transaction."""
+        login_data = LoginRequest(email="test@example.com", password="testpassword123")
+        user_data, _ = await auth_service.authenticate_user(login_data)
+        tokens = await auth_service.create_tokens(user_data)
+
+        query_counter.clear()
+        new_tokens, error = await auth_service.refresh_tokens(tokens["refresh_token"])
+
+        assert error is None
+        assert new_tokens["refresh_token"] != tokens["refresh_token"]
+        verbs = [statement.split(None, 1)[0].upper() for statement in query_counter]
+        assert verbs == ["UPDATE", "SELECT", "DELETE", "INSERT"]
+
+    async def test_refresh_token_reuse_revokes_all_tokens(self, auth_service, test_user):
+        """Test that replaying a consumed token revokes the user's tokens."""
+        login_data = LoginRequest(email="test@example.com", password="testpassword123")
+        user_data, _ = await auth_service.authenticate_user(login_data)
+        tokens = await auth_service.create_tokens(user_data)
+
+        new_tokens, error = await auth_service.refresh_tokens(tokens["refresh_token"])
+        assert error is None
+
+        replayed, error = await auth_service.refresh_tokens(tokens["refresh_token"])
+        assert replayed is None
+        assert error == "Invalid or expired refresh token"
+
+        rotated, error = await auth_service.refresh_tokens(new_tokens["refresh_token"])
+        assert rotated is None
+
+    async def test_refresh_token_stored_as_digest(self, auth_service, session, test_user):
+        """Test that only the SHA-256 digest of a refresh token is stored."""
+        from app.core.security import SecurityService
+        from app.repositories.refresh_token_repository import RefreshTokenRepository
+
+        login_data = LoginRequest(email="test@example.com", password="testpassword123")
+        user_data, _ = await auth_service.authenticate_user(login_data)
+        tokens = await auth_service.create_tokens(user_data)
+
+        token_repo = RefreshTokenRepository(session)
+        record = await token_repo.get_by_token(tokens["refresh_token"])
+
+        assert record.user_id == test_user.id
+        assert record.token_hash == SecurityService.token_digest(tokens["refresh_token"])
+        assert len(record.token_hash) == 32
+
+    async def test_refresh_tokens_are_capped_per_user(self, auth_service, session, test_user, monkeypatch):
+        """Test that the oldest refresh tokens are dropped beyond the cap."""
+        from sqlalchemy import select, func
+        from app.core.config import settings
+        from app.models.refresh_token import RefreshToken
+        from app.repositories.refresh_token_repository import RefreshTokenRepository
+
+        monkeypatch.setattr(settings, "MAX_REFRESH_TOKENS_PER_USER", 3)
+        login_data = LoginRequest(email="test@example.com", password="testpassword123")
+        user_data, _ = await auth_service.authenticate_user(login_data)
+
+        issued = [await auth_service.create_tokens(user_data) for _ in range(5)]
+
+        count = await session.scalar(
+            select(func.count()).select_from(RefreshToken).where(RefreshToken.user_id == test_user.id)
+        )
+        assert count == 3
+
+        token_repo = RefreshTokenRepository(session)
+        assert await token_repo.get_by_token(issued[0]["refresh_token"]) is None
+        assert await token_repo.get_by_token(issued[-1]["refresh_token"]) is not None
+
+    async def test_consumed_markers_are_capped_per_user(self, auth_service, session, test_user, monkeypatch):
+        """Test that repeated rotation keeps the user's token rows bounded."""
+        from sqlalchemy import select, func
+        from app.core.config import settings
+        from app.models.refresh_token import RefreshToken
+
+        monkeypatch.setattr(settings, "MAX_REFRESH_TOKENS_PER_USER", 3)
+        monkeypatch.setattr(settings, "MAX_CONSUMED_REFRESH_TOKENS_PER_USER", 2)
+        login_data = LoginRequest(email="test@example.com", password="testpassword123")
+        user_data, _ = await auth_service.authenticate_user(login_data)
+
+        tokens = await auth_service.create_tokens(user_data)
+        for _ in range(10):
+            tokens, error = await auth_service.refresh_tokens(tokens["refresh_token"])
+            assert error is None
+
+        rows = (await session.execute(
+            select(RefreshToken.is_active, func.count())
+            .where(RefreshToken.user_id == test_user.id)
+            .group_by(RefreshToken.is_active)
+        )).all()
+        assert dict(rows) == {True: 1, False: 2}
+
+    async def test_trimmed_token_is_rejected_without_revocation(self, auth_service, session, test_user, monkeypatch):
+        """Test that a token dropped by the cap is refused without logging out other sessions."""
+        from sqlalchemy import select, func
+        from app.core.config import settings
+        from app.models.refresh_token import RefreshToken
+
+        monkeypatch.setattr(settings, "MAX_REFRESH_TOKENS_PER_USER", 2)
+        login_data = LoginRequest(email="test@example.com", password="testpassword123")
+        user_data, _ = await auth_service.authenticate_user(login_data)
+        issued = [await auth_service.create_tokens(user_data) for _ in range(3)]
+
+        refreshed, error = await auth_service.refresh_tokens(issued[0]["refresh_token"])
+        assert refreshed is None
+        assert error == "Invalid or expired refresh token"
+
+        live = await session.scalar(
+            select(func.count()).select_from(RefreshToken)
+            .where(RefreshToken.user_id == test_user.id, RefreshToken.is_active == True)
+        )
+        assert live == 2
+
+        rotated, error = await auth_service.refresh_tokens(issued[-1]["refresh_token"])
+        assert error is None
+        assert rotated is not None
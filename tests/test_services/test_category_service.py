@@ -0,0 +1,43 @@
+import pytest_asyncio
+from app.core.category_registry import category_registry
+from app.services.category_service import CategoryService
+from app.schemas.category import CategoryCreate, CategoryUpdate
+
+
+class TestCategoryService:
+    @pytest_asyncio.fixture
+    async def category_service(self, session):
+        from app.repositories.category_repository import CategoryRepository
+        from app.repositories.post_repository import PostRepository
+
+        return CategoryService(CategoryRepository(session), PostRepository(session), session)
+
+    async def test_writes_refresh_registry(self, category_service, session, query_counter):
+        """Test that committed category changes are visible in the registry."""
+        await category_registry.snapshot(session)
+
+        created, error = await category_service.create_category(
+            CategoryCreate(name="News", slug="news")
+        )
+        assert created.id is not None
+        assert created.created_at is not None
+
+        query_counter.clear()
+        category = await category_registry.get_by_slug(session, "news")
+        assert category.name == "News"
+        assert query_counter == []
+
+        updated, _ = await category_service.update_category(category.id, CategoryUpdate(name="Latest"))
+        assert updated.name == "Latest"
+        assert (await category_registry.get_by_id(session, category.id)).name == "Latest"
+
+        await category_service.delete_category(category.id)
+        assert (await category_registry.get_by_id(session, category.id)).is_active is False
+
+    async def test_duplicate_slug_from_unique_index(self, category_service, test_category):
+        """Test that the slug unique index is reported as a duplicate."""
+        category, error = await category_service.create_category(
+            CategoryCreate(name="Copy", slug=test_category.slug)
+        )
+        assert category is None
+        assert error == "Category with this slug already exists"
@@ -1,5 +1,6 @@
 import pytest
 import pytest_asyncio
+from app.core.category_registry import category_registry
 from app.services.post_service import PostService
 from app.schemas.post import PostCreate, PostUpdate
 
@@ -25,9 +26,12 @@ class TestPostService:
             is_published=True
         )
 
-        success, error = await post_service.create_post(test_user.id, post_data)
-        assert success is True
+        post, error = await post_service.create_post(test_user.id, post_data)
         assert error is None
+        assert post.id is not None
+        assert post.created_at is not None
+        assert post.author.id == test_user.id
+        assert post.category.slug == test_category.slug
 
     async def test_create_post_invalid_category(self, post_service, test_user):
         """Test post creation with invalid category."""
@@ -39,8 +43,8 @@ class TestPostService:
             is_published=True
         )
 
-        success, error = await post_service.create_post(test_user.id, post_data)
-        assert success is False
+        post, error = await post_service.create_post(test_user.id, post_data)
+        assert post is None
         assert "Category not found" in error
 
     async def test_create_post_duplicate_slug(self, post_service, test_user, test_category):
@@ -51,8 +55,8 @@ class TestPostService:
             content="First post content",
             category_id=test_category.id
         )
-        success1, error1 = await post_service.create_post(test_user.id, post_data1)
-        assert success1 is True
+        post1, error1 = await post_service.create_post(test_user.id, post_data1)
+        assert post1 is not None
 
         post_data2 = PostCreate(
             title="Second Post",
@@ -60,10 +64,25 @@ class TestPostService:
             content="Second post content",
             category_id=test_category.id
         )
-        success2, error2 = await post_service.create_post(test_user.id, post_data2)
-        assert success2 is False
+        post2, error2 = await post_service.create_post(test_user.id, post_data2)
+        assert post2 is None
         assert "already exists" in error2
 
+    async def test_update_post_duplicate_slug(self, post_service, test_user, test_category):
+        """Test that the slug unique index is reported as a duplicate on update."""
+        await post_service.create_post(
+            test_user.id,
+            PostCreate(title="First", slug="first-slug", content="Content", category_id=test_category.id)
+        )
+        second, _ = await post_service.create_post(
+            test_user.id,
+            PostCreate(title="Second", slug="second-slug", content="Content", category_id=test_category.id)
+        )
+
+        post, error = await post_service.update_post(second.id, PostUpdate(slug="first-slug"))
+        assert post is None
+        assert error == "Post with this slug already exists"
+
     async def test_update_post_success(self, post_service, test_user, test_category, session):
         """Test successful post update."""
         from app.repositories.post_repository import PostRepository
@@ -83,9 +102,11 @@ class TestPostService:
             content="Updated content"
         )
 
-        success, error = await post_service.update_post(post.id, update_data)
-        assert success is True
+        updated, error = await post_service.update_post(post.id, update_data)
         assert error is None
+        assert updated.title == "Updated Title"
+        assert updated.updated_at is not None
+        assert updated.category.id == test_category.id
 
         updated_post = await post_repo.get_by_id(post.id)
         assert updated_post.title == "Updated Title"
@@ -110,4 +131,89 @@ class TestPostService:
         assert error is None
 
         deleted_post = await post_repo.get_by_id(post.id)
-        assert deleted_post.is_active is False
\ No newline at end of file
+        assert deleted_post.is_active is False
+
+    async def test_write_returns_entity_without_refetch(
+            self, post_service, test_user, test_category, session, query_counter
+    ):
+        """Test that create skips the slug pre-check and reads back via RETURNING plus one relations query."""
+        await category_registry.snapshot(session)
+        post_data = PostCreate(
+            title="Returned Post",
+            slug="returned-post",
+            content="Content",
+            category_id=test_category.id
+        )
+        query_counter.clear()
+        post, _ = await post_service.create_post(test_user.id, post_data)
+
+        # INSERT ... RETURNING, then author and category together
+        assert [statement.split()[0] for statement in query_counter] == ["INSERT", "SELECT"]
+        assert post.author.email == test_user.email
+
+    async def test_published_total_follows_writes(self, post_service, test_user, test_category, session):
+        """Test that cached post counters stay in sync with service writes."""
+        from app.repositories.post_repository import PostRepository
+
+        total, exact = await post_service.get_published_total()
+        assert (total, exact) == (0, True)
+
+        post_data = PostCreate(
+            title="Counted Post",
+            slug="counted-post",
+            content="Content that is counted",
+            category_id=test_category.id,
+            is_published=True
+        )
+        created, _ = await post_service.create_post(test_user.id, post_data)
+        assert created is not None
+
+        assert await post_service.get_published_total() == (1, True)
+        assert await post_service.get_published_total(test_category.id) == (1, True)
+        # a counter cache hit is still a COUNT(*) result, not a planner estimate
+        assert await post_service.get_published_total() == (1, True)
+
+        post = await PostRepository(session).get_by_slug("counted-post")
+        success, _ = await post_service.delete_post(post.id)
+        assert success is True
+
+        assert await post_service.get_published_total() == (0, True)
+        assert await post_service.get_total() == (1, True)
+
+    async def test_total_is_inexact_only_for_estimates(self, post_service, monkeypatch):
+        """Test that only a planner estimate is reported as an inexact total."""
+        from app.core.config import settings
+
+        async def estimate_count():
+            return 5000
+
+        monkeypatch.setattr(settings, "POST_COUNT_APPROXIMATE", True)
+        monkeypatch.setattr(settings, "POST_COUNT_APPROXIMATE_MIN_ROWS", 1000)
+        monkeypatch.setattr(post_service._post_repository, "estimate_count", estimate_count)
+
+        assert await post_service.get_total() == (5000, False)
+
+        monkeypatch.setattr(settings, "POST_COUNT_APPROXIMATE", False)
+        assert await post_service.get_total() == (0, True)
+        assert await post_service.get_total() == (0, True)
+
+    async def test_published_total_unknown_on_count_failure(self, post_service, monkeypatch):
+        """Test that a failed count is reported as unknown rather than zero."""
+        async def failed_count(category_id=None):
+            return None
+
+        monkeypatch.setattr(post_service._post_repository, "count_published", failed_count)
+
+        total, _ = await post_service.get_published_total()
+        assert total is None
+
+    async def test_update_post_unknown_field_returns_error(self, post_service, monkeypatch):
+        """Test that repository field validation surfaces as an error tuple, not an exception."""
+        async def update(post_id, **kwargs):
+            raise ValueError("Unknown fields for Post: titel")
+
+        monkeypatch.setattr(post_service._post_repository, "update", update)
+
+        post, error = await post_service.update_post(1, PostUpdate(title="Renamed"))
+        assert post is None
+        assert error == "Unknown fields for Post: titel"
@@ -0,0 +1,81 @@
+import asyncio
+import pytest
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from app.core.security import SecurityService
+from sqlalchemy.exc import OperationalError
+from app.models.refresh_token import RefreshToken
+from app.services.token_sweeper import TokenSweeper
+
+
+class TestTokenSweeper:
+    async def test_sweep_deletes_expired_tokens_in_batches(self, session, test_user, query_counter):
+        """Test that expired tokens are removed in bounded batches."""
+        now = datetime.now(timezone.utc)
+        for index in range(5):
+            session.add(RefreshToken(
+                token_hash=SecurityService.token_digest(f"expired-{index}"),
+                expires_at=now - timedelta(days=1),
+                user_id=test_user.id
+            ))
+        session.add(RefreshToken(
+            token_hash=SecurityService.token_digest("live"),
+            expires_at=now + timedelta(days=1),
+            user_id=test_user.id
+        ))
+        await session.commit()
+
+        @asynccontextmanager
+        async def session_factory():
+            yield session
+
+        sweeper = TokenSweeper(session_factory, batch_size=2, interval=60, duty_cycle=1.0)
+        query_counter.clear()
+
+        assert await sweeper.sweep() == 5
+        assert [statement.split(None, 1)[0].upper() for statement in query_counter] == ["DELETE"] * 3
+
+        stats = sweeper.stats()
+        assert stats["deleted"] == 5
+        assert stats["batches"] == 3
+        assert stats["last_run_deleted"] == 5
+
+        from app.repositories.refresh_token_repository import RefreshTokenRepository
+        assert await RefreshTokenRepository(session).get_by_token("live") is not None
+
+    async def test_start_and_stop(self, session):
+        """Test that the background task can be started and cancelled."""
+        @asynccontextmanager
+        async def session_factory():
+            yield session
+
+        sweeper = TokenSweeper(session_factory, batch_size=10, interval=60, duty_cycle=1.0)
+        sweeper.start()
+        assert sweeper.stats()["running"] is True
+
+        await sweeper.stop()
+        assert sweeper.stats()["running"] is False
+
+    async def test_failed_sweep_is_counted(self):
+        """Test that database errors reach the sweeper's error counter."""
+        class FailingSession:
+            async def execute(self, *args, **kwargs):
+                raise OperationalError("DELETE", {}, Exception("database is down"))
+
+        @asynccontextmanager
+        async def session_factory():
+            yield FailingSession()
+
+        sweeper = TokenSweeper(session_factory, batch_size=10, interval=60, duty_cycle=1.0)
+        sweeper.start()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        await sweeper.stop()
+
+        assert sweeper.stats()["errors"] == 1
+        assert sweeper.stats()["runs"] == 0
+
+    def test_duty_cycle_must_be_positive(self):
+        """Test that a zero duty cycle is rejected up front."""
+        with pytest.raises(ValueError):
+            TokenSweeper(lambda: None, batch_size=10, interval=60, duty_cycle=0)